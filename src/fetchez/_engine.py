@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+fetchez._engine
+~~~~~~~~~~~~~~~
+Shared orchestration for the config-driven workflows (Pipeline and Recipe):
+path, region and hook resolution, module construction and execution.
+
+:copyright: (c) 2010-2026 Regents of the University of Colorado
+:license: MIT, see LICENSE for more details.
+"""
+
+import os
+import logging
+import concurrent.futures
+
+from .core import run_fetchez
+from .spatial import parse_region
+from .registry import FetchezRegistry
+from .hooks.registry import HookRegistry
+from .utils import TqdmLoggingHandler
+from . import config
+from . import presets
+from . import utils
+
+logger = logging.getLogger(__name__)
+
+# Remote paths that should never be resolved against base_dir
+_URL_PREFIXES = ("http", "s3://", "gs://", "ftp://")
+
+# Hook arguments that hold file paths
+_PATH_KEYS = frozenset(
+    {"file", "output", "output_grid", "mask_fn", "dem", "barrier", "aux_path", "path"}
+)
+
+# Shared defaults for bare-string module entries; never mutate these
+_NO_ARGS = {}
+_NO_HOOKS = ()
+
+
+# The root handler installed by setup_logging, so repeat calls can be skipped
+_LOG_HANDLER = None
+
+
+def setup_logging(verbose=False):
+    global _LOG_HANDLER
+
+    log_level = logging.INFO if verbose else logging.WARNING
+
+    logger = logging.getLogger()
+    # Already configured (and not since replaced by someone else)
+    if logger.level == log_level and logger.handlers == [_LOG_HANDLER]:
+        return
+
+    logger.setLevel(log_level)
+
+    if logger.hasHandlers():
+        logger.handlers.clear()
+
+    handler = TqdmLoggingHandler()
+    formatter = logging.Formatter("[ %(levelname)s ] %(name)s: %(message)s")
+    handler.setFormatter(formatter)
+    logger.addHandler(handler)
+    _LOG_HANDLER = handler
+
+
+def _run_module(mod):
+    """Generate a module's URLs, logging (not raising) any failure."""
+
+    try:
+        mod.run()
+    except Exception as e:
+        logger.error(f"Module '{mod.name}' failed to generate URLs (Skipping): {e}")
+
+
+class Workflow:
+    """Base class for workflows defined in a config dictionary.
+
+    Subclasses provide the entry points (`from_file`, `run`); this class
+    turns the config's hooks, regions and modules into queued FetchModules
+    and executes them.
+    """
+
+    default_name = "Untitled"
+    default_threads = 3
+
+    def __init__(self, config, base_dir=None):
+        self.config = config
+        # If no base_dir provided (Dict mode), default to CWD
+        self.base_dir = os.path.abspath(base_dir or os.getcwd())
+        self.name = self.config.get("project", {}).get("name", self.default_name)
+        self._hook_presets = None
+        self._hook_mod_presets = None
+        self._region_cache = {}
+        self._hook_cache = {}
+        self._preset_cache = {}
+        setup_logging(True)
+
+    def _resolve_path(self, path):
+        """Resolves paths relative to the config file (base_dir)."""
+
+        if not isinstance(path, str):
+            return path
+        # Cheap first-character check before walking the prefixes
+        if path[:1] in "hsgf" and path.startswith(_URL_PREFIXES):
+            return path
+        if os.path.isabs(path):
+            return path
+
+        # base_dir is already absolute, so skip abspath's getcwd()
+        return os.path.normpath(os.path.join(self.base_dir, path))
+
+    def _parse_region(self, region_def):
+        """Parse a region definition, reusing the result for repeated literals."""
+
+        key = repr(region_def)
+        if key not in self._region_cache:
+            self._region_cache[key] = parse_region(region_def)
+        return self._region_cache[key]
+
+    def _get_hook(self, HookCls, name, kwargs):
+        """Instantiate a hook, reusing the instance for identical specs."""
+
+        if not getattr(HookCls, "shareable", True):
+            return HookCls(**kwargs)
+
+        key = utils.hook_spec_key(name, kwargs)
+        hook = self._hook_cache.get(key)
+        if hook is None:
+            hook = self._hook_cache[key] = HookCls(**kwargs)
+        return hook
+
+    def _preset_chain(self, preset_def):
+        """Build the hook list for a preset, once per preset definition."""
+
+        chain = self._preset_cache.get(id(preset_def))
+        if chain is None:
+            chain = presets.hook_list_from_preset(preset_def)
+            if all(getattr(h, "shareable", True) for h in chain):
+                self._preset_cache[id(preset_def)] = chain
+        return chain
+
+    def _init_hooks(self, hook_defs, mod=None):
+        """Initialize hooks from list of dicts."""
+
+        if not hook_defs:
+            return []
+
+        HookRegistry.load_builtins()
+        # Load the user presets once per run, not once per hook list
+        if self._hook_presets is None:
+            self._hook_presets = presets.get_global_presets()
+            self._hook_mod_presets = config.load_user_config("presets").get(
+                "modules", {}
+            )
+        hook_presets = self._hook_presets
+        hook_mod_presets = self._hook_mod_presets
+
+        active_hooks = []
+        for h in hook_defs:
+            name = h.get("name")
+            is_preset = h.get("preset")
+            raw_kwargs = h.get("args", {})
+            kwargs = {}
+            for k, v in raw_kwargs.items():
+                if k in _PATH_KEYS:
+                    kwargs[k] = self._resolve_path(v)
+                else:
+                    kwargs[k] = v
+
+            # Check for global and mod-specific presets from ~/.fetchez/presets.yaml
+            if is_preset:
+                try:
+                    hook_def = hook_presets.get(is_preset, {})
+                    if hook_def:
+                        active_hooks.extend(self._preset_chain(hook_def))
+                    if mod:
+                        mod_hooks = hook_mod_presets.get(mod, {}).get("presets", {})
+                        hook_def = mod_hooks.get(is_preset, {})
+                        if hook_def:
+                            active_hooks.extend(self._preset_chain(hook_def))
+                except Exception as e:
+                    logger.error(f"Could not load preset {is_preset}: {e}")
+            else:
+                HookCls = HookRegistry.get_hook(name)
+                if HookCls:
+                    try:
+                        active_hooks.append(self._get_hook(HookCls, name, kwargs))
+                    except Exception as e:
+                        logger.error(f"Failed to init hook {name}: {e}")
+                else:
+                    logger.warning(f"Hook '{name}' not found.")
+
+        return active_hooks
+
+    def _build_modules(self):
+        """Instantiate each configured module once per target region."""
+
+        global_region_def = self.config.get("region")
+        global_regions = (
+            self._parse_region(global_region_def) if global_region_def else [None]
+        )
+
+        modules_to_run = []
+        for mod_def in self.config.get("modules", []):
+            if isinstance(mod_def, str):
+                mod_key, mod_args, mod_hooks = mod_def, _NO_ARGS, _NO_HOOKS
+                mod_region_def = None
+            else:
+                mod_key = mod_def.get("module")
+                mod_args = mod_def.get("args", {})
+                mod_hooks = self._init_hooks(mod_def.get("hooks", []), mod=mod_key)
+                mod_region_def = mod_def.get("region")
+
+            mod_regions = (
+                self._parse_region(mod_region_def) if mod_region_def else global_regions
+            )
+
+            if not mod_regions or mod_regions == [None]:
+                logger.warning(f"Module '{mod_key}' has no target region. Skipping.")
+                continue
+
+            ModCls = FetchezRegistry.load_module(mod_key)
+            if not ModCls:
+                logger.error(f"Unknown module: {mod_key}")
+                continue
+
+            # Resolve into a copy, leaving the loaded config untouched
+            if "path" in mod_args:
+                mod_args = {**mod_args, "path": self._resolve_path(mod_args["path"])}
+
+            for region in mod_regions:
+                try:
+                    instance = ModCls(src_region=region, hook=mod_hooks, **mod_args)
+                    modules_to_run.append(instance)
+                except Exception as e:
+                    logger.error(f"Failed to init module {mod_key}: {e}")
+
+        return modules_to_run
+
+    def _run_modules(self):
+        """Build, query and fetch the configured modules.
+
+        Returns:
+            bool: False if there was nothing to run.
+        """
+
+        run_opts = self.config.get("execution", {})
+        threads = run_opts.get("threads", self.default_threads)
+
+        global_hooks = self._init_hooks(self.config.get("global_hooks", []))
+        modules_to_run = self._build_modules()
+
+        if not modules_to_run:
+            logger.warning("No valid modules to run.")
+            return False
+
+        logger.info(f"Queued {len(modules_to_run)} module queries. Searching...")
+        # Some modules build shared on-disk state (FRED indexes, layer caches)
+        # during run(). Query the first instance of each module class before
+        # the rest, so the others (e.g. further regions) find it ready instead
+        # of racing to build it.
+        first, rest = [], []
+        seen = set()
+        for mod in modules_to_run:
+            (rest if type(mod) in seen else first).append(mod)
+            seen.add(type(mod))
+
+        # URL generation is network bound, so query the modules concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(_run_module, first))
+            list(executor.map(_run_module, rest))
+
+        run_fetchez(modules_to_run, threads=threads, global_hooks=global_hooks)
+        return True
@@ -80,10 +80,9 @@ def get(
         A list of absolute paths to the downloaded files.
     """
 
-    FetchezRegistry.load_user_plugins()
-    FetchezRegistry.load_installed_plugins()
     HookRegistry.load_builtins()
 
+    # load_module pulls in the user/installed plugins on first use
     ModCls = FetchezRegistry.load_module(module)
     if not ModCls:
         raise ValueError(f"Unknown module: {module}")
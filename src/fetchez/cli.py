@@ -17,6 +17,7 @@ import logging
 import argparse
 import inspect
 import signal
+import functools
 from typing import Dict, Optional, Any
 
 from . import utils
@@ -110,19 +111,16 @@ def parse_fmod_argparse(arg_str):
     return None, mod_name, args
 
 
-def _populate_subparser(
-    subparser, module_cls, global_args=["self", "kwargs", "params"]
-):
-    """Introspect module __init__ to populate subparser arguments."""
-
-    if not module_cls:
-        return
+@functools.lru_cache(maxsize=None)
+def _module_cli_args(module_cls):
+    """Introspect module __init__ once into (flag, add_argument kwargs) pairs."""
 
     sig = inspect.signature(module_cls.__init__)
 
     # Get help text from decorator if available
     arg_help = getattr(module_cls, "_cli_arg_help", {})
 
+    cli_args = []
     for name, param in sig.parameters.items():
         # Skip base FetchModule arguments that are handled globally
         if name in [
@@ -147,7 +145,7 @@ def _populate_subparser(
         # Handle Boolean Flags
         if param.annotation is bool or isinstance(default, bool):
             action = "store_true" if not default else "store_false"
-            subparser.add_argument(f"--{name}", action=action, help=help_str)
+            cli_args.append((f"--{name}", {"action": action, "help": help_str}))
         else:
             type_fn = None
             if param.annotation is int:
@@ -155,13 +153,31 @@ def _populate_subparser(
             elif param.annotation is float:
                 type_fn = float
 
-            subparser.add_argument(
-                f"--{name}",
-                default=default,
-                type=type_fn,
-                help=f"{help_str} (default: {default})",
+            cli_args.append(
+                (
+                    f"--{name}",
+                    {
+                        "default": default,
+                        "type": type_fn,
+                        "help": f"{help_str} (default: {default})",
+                    },
+                )
             )
 
+    return tuple(cli_args)
+
+
+def _populate_subparser(
+    subparser, module_cls, global_args=["self", "kwargs", "params"]
+):
+    """Introspect module __init__ to populate subparser arguments."""
+
+    if not module_cls:
+        return
+
+    for flag, kwargs in _module_cli_args(module_cls):
+        subparser.add_argument(flag, **kwargs)
+
 
 # =============================================================================
 # Registry & Help Helpers
@@ -681,27 +697,23 @@ def fetchez_cli():
         global_hook_objs.append(Audit(file=global_args.audit_log))
 
     # --- Parse out modules/commands ---
-    module_keys = {}
-    for key, val in registry.FetchezRegistry._modules.items():
-        module_keys[key] = key
-        for alias in val.get("aliases", []):
-            module_keys[alias] = key
+    # Module names and aliases both resolve through the registry's index
+    resolve_key = registry.FetchezRegistry.resolve_key
 
     commands = []
     current_cmd = None
     current_args = []
     for arg in remaining_argv:
-        is_module = (arg in module_keys) or (arg.split(":")[0] in module_keys)
+        mod_key = resolve_key(arg.split(":")[0])
 
-        if is_module and not arg.startswith("-"):
+        if mod_key is not None and not arg.startswith("-"):
             if current_cmd:
                 commands.append((current_cmd, current_args))
 
-            if len(arg.split(":")) > 1:
-                _, raw_name, current_args = parse_fmod_argparse(arg)
-                current_cmd = module_keys.get(raw_name, raw_name)
+            current_cmd = mod_key
+            if ":" in arg:
+                _, _, current_args = parse_fmod_argparse(arg)
             else:
-                current_cmd = module_keys.get(arg, arg)
                 current_args = []
         else:
             if current_cmd and current_cmd != "file":
@@ -12,31 +12,98 @@ config file ~/.fetchez/ ...
 """
 
 import os
+import copy
 import json
+import mmap
 import yaml
 import logging
+import threading
+
+from . import utils
 
 home_dir = os.path.expanduser("~")
 CONFIG_PATH = os.path.join(home_dir, ".fetchez")
 
 logger = logging.getLogger(__name__)
 
+# Parsed user config files, keyed on path: (mtime_ns, size), data
+_CONFIG_CACHE = {}
+_CONFIG_LOCK = threading.Lock()
+
+# Use the libyaml (C) bindings when PyYAML was built with them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Files smaller than this are read directly; mapping them costs more than it saves
+MMAP_THRESHOLD = 4096
+
+
+def yaml_load(stream):
+    """Safely parse YAML from a string or open file."""
+
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def yaml_dump(data, stream, **kwargs):
+    """Safely dump `data` as YAML to an open file."""
+
+    return yaml.dump(data, stream, Dumper=YAML_DUMPER, **kwargs)
+
+
+def load_config_file(filepath):
+    """Parse a YAML or JSON recipe/config file.
+
+    Large files are memory-mapped and handed straight to the parser rather
+    than being copied through a Python-level read buffer first.
+    """
+
+    is_yaml = filepath.lower().endswith((".yaml", ".yml"))
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            data = f.read()
+            return yaml_load(data) if is_yaml else utils.json_loads(data)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if is_yaml:
+                return yaml_load(mm)
+            with memoryview(mm) as view:
+                return utils.json_loads(view)
+
 
 def load_user_config(config_name):
-    """Load the user's config file. Can be yaml or json."""
+    """Load the user's config file. Can be yaml or json.
+
+    Parsed files are cached on their (mtime, size), so loading an unchanged
+    file again skips the parse. Callers get their own copy of the data.
+    """
 
     exts = [".yaml", ".yml", ".json"]
 
     for ext in exts:
         config_file = os.path.join(CONFIG_PATH, config_name + ext)
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, "r") as f:
-                    if config_file.endswith(".json"):
-                        return json.load(f)
-                    else:
-                        return yaml.safe_load(f) or {}
-            except Exception as e:
-                logger.warning(f"Could not load config file {config_file}: {e}")
+        try:
+            st = os.stat(config_file)
+        except OSError:
+            continue
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _CONFIG_LOCK:
+            cached = _CONFIG_CACHE.get(config_file)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+
+        try:
+            with open(config_file, "r") as f:
+                if config_file.endswith(".json"):
+                    data = json.load(f)
+                else:
+                    data = yaml_load(f) or {}
+        except Exception as e:
+            logger.warning(f"Could not load config file {config_file}: {e}")
+            continue
+
+        with _CONFIG_LOCK:
+            _CONFIG_CACHE[config_file] = (stamp, data)
+        return copy.deepcopy(data)
 
     return {}
@@ -15,7 +15,9 @@ threading, and the base FetchModule class.
 
 import os
 import time
+import json
 import base64
+import hashlib
 import threading
 import netrc
 import io
@@ -29,20 +31,18 @@ from typing import List, Dict, Optional, Any, Tuple
 import concurrent.futures
 
 import requests
+from requests.adapters import HTTPAdapter
 import lxml.etree
 import lxml.html as lh
 
-try:
-    from shapely.geometry import Polygon, mapping
-
-    HAS_SHAPELY = True
-except ImportError:
-    HAS_SHAPELY = False
-
 from . import utils
 from . import spatial
+from . import config
 from . import __version__
 
+# shapely is imported where it is used; see spatial.HAS_SHAPELY
+HAS_SHAPELY = spatial.HAS_SHAPELY
+
 STOP_EVENT = threading.Event()
 
 CUDEM_USER_AGENT = f"Fetches/{__version__}"
@@ -64,6 +64,11 @@ logger = logging.getLogger(__name__)
 
 HOOK_LOCK = threading.Lock()
 
+HTTP_CACHE_DIR = os.path.join(config.CONFIG_PATH, "cache", "http")
+HTTP_CACHE_TTL = 86400  # 1 day
+
+_THREAD_LOCAL = threading.local()
+
 
 # =============================================================================
 # Helper Functions
@@ -76,6 +81,25 @@ def fetches_callback(r: List[Any]):
     pass
 
 
+def get_session() -> requests.Session:
+    """Return this thread's pooled `requests.Session`.
+
+    Downloads run in a thread pool (see `run_fetchez`); giving each worker
+    its own keep-alive session lets consecutive files from the same host
+    (e.g. STAC assets) reuse the open TCP/TLS connection. `Fetch.fetch_req`
+    goes through it too, so paged metadata queries reuse connections as well.
+    """
+
+    session = getattr(_THREAD_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _THREAD_LOCAL.session = session
+    return session
+
+
 def urlencode_(opts: Dict) -> str:
     """Encode `opts` for use in a URL."""
 
@@ -312,6 +336,8 @@ class iso_xml:
             out_poly = [[lon, lat] for lat, lon in out_poly]
             if geom:
                 if HAS_SHAPELY:
+                    from shapely.geometry import Polygon, mapping
+
                     poly = Polygon(out_poly)
                     geojson_dict = mapping(poly)
                 else:
@@ -331,21 +357,33 @@ class HttpFile(io.IOBase):
     """A file-like object backed by an HTTP URL.
 
     Translates read() calls into HTTP Range requests to fetch only needed bytes.
+    Small reads are rounded up to `block_size` and served from the last fetched
+    block, so readers that do many tiny reads (e.g. zipfile) don't issue a
+    request per read.
     """
 
-    def __init__(self, url, session=None, callback=None):
+    def __init__(self, url, session=None, callback=None, block_size=65536):
         self.url = url
         self.session = session or requests.Session()
         self.callback = callback
+        self.block_size = block_size
         self.offset = 0
+        self._buf = b""
+        self._buf_start = 0
         self.size = self._get_size()
 
     def _get_size(self):
-        resp = self.session.head(self.url)
+        resp = self.session.head(self.url, allow_redirects=True)
         if "Content-Length" not in resp.headers:
             return 0
         return int(resp.headers["Content-Length"])
 
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
     def seek(self, offset, whence=io.SEEK_SET):
         if whence == io.SEEK_SET:
             self.offset = offset
@@ -370,15 +408,34 @@ class HttpFile(io.IOBase):
         if self.offset > end:
             return b""
 
+        # Serve from the last fetched block if it covers the request
+        buf_end = self._buf_start + len(self._buf) - 1
+        if self._buf_start <= self.offset and end <= buf_end:
+            i = self.offset - self._buf_start
+            data = self._buf[i : i + end - self.offset + 1]
+            self.offset += len(data)
+            return data
+
+        fetch_end = min(max(end, self.offset + self.block_size - 1), self.size - 1)
+
         # Fetch ONLY the specific bytes requested
-        headers = {"Range": f"bytes={self.offset}-{end}"}
+        headers = {"Range": f"bytes={self.offset}-{fetch_end}"}
         response = self.session.get(self.url, headers=headers)
         response.raise_for_status()
 
-        data = response.content
-
+        block = response.content
         if self.callback:
-            self.callback(len(data))
+            self.callback(len(block))
+
+        if response.status_code == 200:
+            # Server ignored the range and sent the whole file; keep all of it
+            self._buf_start = 0
+            self._buf = block
+            data = block[self.offset : end + 1]
+        else:
+            self._buf_start = self.offset
+            self._buf = block
+            data = block[: end - self.offset + 1]
 
         self.offset += len(data)
         return data
@@ -430,7 +487,7 @@ class Fetch:
                     current_read_timeout if current_read_timeout else None,
                 )
 
-                req = requests.request(
+                req = get_session().request(
                     method=method,
                     url=self.url,
                     params=params,
@@ -573,7 +630,7 @@ class Fetch:
                     mode = "ab"
 
             try:
-                with requests.get(
+                with get_session().get(
                     self.url,
                     stream=True,
                     params=params,
@@ -707,6 +764,160 @@ class Fetch:
 
         return -1
 
+    def fetch_file_parallel(
+        self,
+        dst_fn: str,
+        parallel: int = 8,
+        chunk_size: int = 64 * 1024 * 1024,
+        overwrite=False,
+        timeout=30,
+        read_timeout=None,
+        tries=5,
+        verbose=True,
+    ) -> int:
+        """Fetch src_url and save to dst_fn using concurrent HTTP Range requests.
+
+        The remote file is split into `chunk_size` byte ranges which are
+        fetched by `parallel` workers and written in place into a
+        pre-allocated file. Falls back to `fetch_file` (single stream) if the
+        server does not advertise or honor byte ranges.
+        """
+
+        if not overwrite and os.path.exists(dst_fn) and os.path.getsize(dst_fn) > 0:
+            return 0
+
+        def _single_stream():
+            return self.fetch_file(
+                dst_fn,
+                overwrite=overwrite,
+                timeout=timeout,
+                read_timeout=read_timeout,
+                tries=tries,
+                verbose=verbose,
+            )
+
+        headers = {k: v for k, v in self.headers.items() if k != "Range"}
+        try:
+            head = get_session().head(
+                self.url,
+                headers=headers,
+                timeout=timeout,
+                verify=self.verify,
+                allow_redirects=self.allow_redirects,
+            )
+            total_size = int(head.headers.get("content-length", 0))
+            accepts_ranges = head.headers.get("accept-ranges", "").lower() == "bytes"
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug(f"HEAD request failed for {self.url}: {e}")
+            return _single_stream()
+
+        if head.status_code != 200 or not accepts_ranges or total_size <= chunk_size:
+            return _single_stream()
+
+        # Use the redirect-resolved URL so each range skips the redirect hop.
+        url = head.url
+        dst_dir = os.path.abspath(os.path.dirname(dst_fn))
+        os.makedirs(dst_dir, exist_ok=True)
+
+        # Not `.part`: this file is full-size (zero-filled) from the start, so
+        # fetch_file must never mistake it for a finished download to resume.
+        part_fn = f"{dst_fn}.ranges"
+
+        ranges = [
+            (start, min(start + chunk_size, total_size) - 1)
+            for start in range(0, total_size, chunk_size)
+        ]
+        no_range_support = threading.Event()
+
+        def _fetch_range(start, end, pbar):
+            for attempt in range(tries):
+                written = 0
+                try:
+                    with get_session().get(
+                        url,
+                        headers={**headers, "Range": f"bytes={start}-{end}"},
+                        stream=True,
+                        timeout=(timeout, read_timeout),
+                        verify=self.verify,
+                    ) as req:
+                        if req.status_code == 200:
+                            # Server ignored the Range header.
+                            no_range_support.set()
+                            return -1
+                        req.raise_for_status()
+
+                        # Each worker writes through its own handle at its own offset.
+                        with open(part_fn, "r+b") as f:
+                            f.seek(start)
+                            for chunk in req.raw.stream(
+                                1024 * 1024, decode_content=False
+                            ):
+                                if STOP_EVENT.is_set() or no_range_support.is_set():
+                                    return -1
+                                f.write(chunk)
+                                written += len(chunk)
+                                pbar.update(len(chunk))
+
+                    if written != end - start + 1:
+                        raise IOError(
+                            f"Incomplete range {start}-{end}: {written} bytes"
+                        )
+                    return 0
+
+                except (requests.exceptions.RequestException, IOError) as e:
+                    pbar.update(-written)
+                    if attempt < tries - 1:
+                        wait_time = (attempt + 1) * 2
+                        logger.debug(
+                            f"Range {start}-{end} failed: {e}. Retrying in {wait_time}s..."
+                        )
+                        time.sleep(wait_time)
+                    else:
+                        logger.error(f"Failed to fetch range {start}-{end}: {e}")
+
+            return -1
+
+        desc = utils.str_truncate_middle(self.url, n=60)
+        try:
+            with open(part_fn, "wb") as f:
+                f.truncate(total_size)
+
+            with tqdm(
+                desc=desc,
+                total=total_size,
+                disable=not verbose or self.silent,
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+                leave=False,
+            ) as pbar:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=parallel
+                ) as executor:
+                    futures = [
+                        executor.submit(_fetch_range, start, end, pbar)
+                        for start, end in ranges
+                    ]
+                    statuses = [future.result() for future in futures]
+
+            if not no_range_support.is_set() and all(
+                status == 0 for status in statuses
+            ):
+                os.rename(part_fn, dst_fn)
+                return 0
+        finally:
+            # Never leave the pre-allocated file behind on failure
+            if os.path.exists(part_fn):
+                os.remove(part_fn)
+
+        if no_range_support.is_set():
+            logger.debug(f"Range requests not honored for {self.url}, streaming.")
+            return _single_stream()
+
+        if STOP_EVENT.is_set():
+            logger.warning("Download cancelled by user.")
+        return -1
+
     def fetch_ftp_file(self, dst_fn, params=None, datatype=None, overwrite=False):
         """Fetch an ftp file via ftplib with a progress bar."""
 
@@ -770,6 +981,58 @@ class Fetch:
         return status
 
 
+class CachedFetch(Fetch):
+    """Fetch JSON metadata through a small on-disk cache.
+
+    Responses are keyed on the url and the sorted request params and kept in
+    `~/.fetchez/cache/http` for `expire_after` seconds. Use this for static,
+    idempotent metadata GETs (layer listings, etc.), not for data files.
+    """
+
+    def _cache_path(self, params: Optional[Dict] = None) -> str:
+        key = json.dumps([self.url, sorted((params or {}).items())], default=str)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(HTTP_CACHE_DIR, f"{digest}.json")
+
+    def fetch_json(
+        self,
+        params: Optional[Dict] = None,
+        expire_after: float = HTTP_CACHE_TTL,
+        force: bool = False,
+        **kwargs,
+    ) -> Optional[Any]:
+        """Return the parsed JSON for url/params, using the cache if fresh.
+
+        Returns None if the request or the JSON parsing fails.
+        """
+
+        cache_fn = self._cache_path(params)
+        if not force and os.path.exists(cache_fn):
+            if time.time() - os.path.getmtime(cache_fn) < expire_after:
+                try:
+                    with open(cache_fn, "rb") as f:
+                        return utils.json_loads(f.read())
+                except (OSError, ValueError):
+                    pass
+
+        req = self.fetch_req(params=params, **kwargs)
+        if req is None or req.status_code != 200:
+            return None
+
+        try:
+            content = req.content
+            data = utils.json_loads(content)
+        except ValueError:
+            return None
+
+        try:
+            utils.write_atomic(cache_fn, content)
+        except OSError as e:
+            logger.debug(f"Could not write HTTP cache {cache_fn}: {e}")
+
+        return data
+
+
 def _fetch_worker(module, entry, verbose=True):
     """Helper wrapper to call fetch_entry on a module."""
 
@@ -1096,6 +1359,17 @@ class FetchModule:
 
         raise NotImplementedError
 
+    def iter_results(self):
+        """Yield the fetch entries of this module.
+
+        The default runs the module and yields `results`. Modules with large
+        inventories can override this to yield entries (see `make_entry`) as
+        they are found, without holding them all on `results`.
+        """
+
+        self.run()
+        yield from self.results
+
     def fetch_entry(self, entry, check_size=True, retries=5, verbose=True):
         try:
             parsed_url = urllib.parse.urlparse(entry["url"])
@@ -1125,16 +1399,21 @@ class FetchModule:
             {"url": entry[0], "dst_fn": entry[1], "data_type": entry[2]}
         )
 
-    def add_entry_to_results(self, url, dst_fn, data_type, **kwargs):
-        """Add fetch entries to `results`. any keyword/args can be
-        added to `results`, but we need `url`, `dst_fn` and `data_type`.
-        """
+    def make_entry(self, url, dst_fn, data_type, **kwargs):
+        """Build a fetch entry dict, with `dst_fn` placed in the outdir."""
 
         if utils.str_or(dst_fn) is not None:
             dst_fn = os.path.join(self._outdir, dst_fn)
         entry = {"url": url, "dst_fn": dst_fn, "data_type": data_type}
         entry.update(kwargs)
-        self.results.append(entry)
+        return entry
+
+    def add_entry_to_results(self, url, dst_fn, data_type, **kwargs):
+        """Add fetch entries to `results`. any keyword/args can be
+        added to `results`, but we need `url`, `dst_fn` and `data_type`.
+        """
+
+        self.results.append(self.make_entry(url, dst_fn, data_type, **kwargs))
 
 
 # Simple Fetch Module to fetch a url.
@@ -17,19 +17,14 @@ that lack a public API but provide file lists (e.g., NCEI Thredds, USACE).
 import os
 import json
 import logging
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 
 from . import utils
 from . import config
 from . import spatial
 
-try:
-    from shapely.geometry import shape
-    # from shapely.strtree import STRtree
-
-    HAS_SHAPELY = True
-except ImportError:
-    HAS_SHAPELY = False
+# shapely is imported where it is used; see spatial.HAS_SHAPELY
+HAS_SHAPELY = spatial.HAS_SHAPELY
 
 logger = logging.getLogger(__name__)
 
@@ -90,8 +85,8 @@ class FRED:
 
         if os.path.exists(self.path):
             try:
-                with open(self.path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.path, "rb") as f:
+                    data = utils.json_loads(f.read())
                     self.features = data.get("features", [])
 
                 msg = (
@@ -101,7 +96,7 @@ class FRED:
                 )
                 logger.info(msg)
 
-            except (json.JSONDecodeError, IOError) as e:
+            except (ValueError, IOError) as e:
                 logger.error(f"Corrupt or unreadable index at {self.path}: {e}")
                 self.features = []
         else:
@@ -120,14 +115,10 @@ class FRED:
             "features": self.features,
         }
 
-        # Ensure directory exists
-        out_dir = os.path.dirname(self.path)
-        if out_dir and not os.path.exists(out_dir):
-            os.makedirs(out_dir)
-
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(data, f, separators=(",", ":"))  # Compact JSON
+            # Atomic (and creates the directory), so a concurrent reader
+            # never sees a half-written index
+            utils.write_atomic(self.path, utils.json_dumps(data).encode("utf-8"))
             logger.info(f"Saved {len(self.features)} items to {self.name} index.")
         except IOError as e:
             logger.error(f"Failed to save FRED index {self.path}: {e}")
@@ -168,12 +159,24 @@ class FRED:
             List of dictionaries containing the properties of matching features.
         """
 
-        results = []
+        results = list(self.iter_search(region=region, where=where, layer=layer))
+        logger.info(f"FRED Search found {len(results)} items.")
+        return results
+
+    def iter_search(
+        self,
+        region: Optional[Tuple[float, float, float, float]] = None,
+        where: List[str] = [],
+        layer: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Like `search`, but yield the matching properties one at a time."""
 
         # Prepare Spatial Filter
         search_geom = None
         if region is not None and spatial.region_valid_p(region):
             if HAS_SHAPELY:
+                from shapely.geometry import shape
+
                 search_geom = spatial.region_to_shapely(region)
             else:
                 search_geom = None  # TODO: update to manually make one from region!
@@ -214,11 +217,8 @@ class FRED:
                     # TODO: Basic bounding box check (if Shapely missing)
                     pass
 
-            # If we passed all filters, add to results
-            results.append(props)
-
-        logger.info(f"FRED Search found {len(results)} items.")
-        return results
+            # If we passed all filters, yield it
+            yield props
 
     def _get_unique_values(self, field: str) -> List[Any]:
         """Helper to see unique values for a field (e.g. Agency)."""
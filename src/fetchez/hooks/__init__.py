@@ -27,6 +27,11 @@ class FetchHook:
     # 'post': Runs once after all downloads are finished.
     stage = "file"
 
+    # Whether one instance may be shared by every module that asks for the
+    # same hook with the same arguments. Hooks that keep per-module state
+    # should set this to False.
+    shareable = True
+
     def __init__(self, **kwargs):
         self.opts = kwargs
 
@@ -27,6 +27,7 @@ class Audit(FetchHook):
     desc = "Save a run summary to a file. Usage: --hook audit:file=log.json"
     stage = "post"
     category = "metadata"
+    shareable = False
 
     def __init__(self, file="audit.json", format="json", **kwargs):
         super().__init__(**kwargs)
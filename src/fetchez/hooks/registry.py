@@ -24,10 +24,18 @@ logger = logging.getLogger(__name__)
 class HookRegistry:
     _hooks: Dict[Any, Any] = {}
 
+    # Each loader only needs to scan once per process
+    _builtins_loaded = False
+    _user_loaded = False
+
     @classmethod
     def load_builtins(cls):
         """Recursively scan and load all built-in hooks from the 'builtins' directory."""
 
+        if cls._builtins_loaded:
+            return
+        cls._builtins_loaded = True
+
         # Determine the absolute path to the 'hooks' directory
         current_dir = os.path.dirname(os.path.abspath(__file__))
         builtins_dir = os.path.join(current_dir, "builtins")
@@ -61,6 +69,10 @@ class HookRegistry:
     def load_user_plugins(cls):
         """Scan ~/.fetchez/hooks/ and .fetchez/hooks for python files."""
 
+        if cls._user_loaded:
+            return
+        cls._user_loaded = True
+
         home = os.path.expanduser("~")
         home_hook_dir = os.path.join(home, ".fetchez", "hooks")
         cwd_hook_dir = os.path.join(home, ".fetchez", "hooks")
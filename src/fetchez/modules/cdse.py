@@ -17,10 +17,13 @@ import datetime
 import time
 import re
 import logging
+import threading
 import xml.etree.ElementTree as ET
+from typing import Dict, Tuple
 
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 from fetchez import utils
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,11 @@ logger = logging.getLogger(__name__)
 CDSE_CATALOGUE_URL = "https://catalogue.dataspace.copernicus.eu/odata/v1"
 CDSE_AUTH_URL = "https://identity.dataspace.copernicus.eu/auth/realms/CDSE/protocol/openid-connect/token"
 
+# Access tokens are shared across CDSE instances in this process,
+# keyed by username: {username: (token, expiry_time)}
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+
 
 @cli.cli_opts(
     help_text="CDSE Direct Node Fetcher (Sentinel-2 JP2 Bands)",
@@ -63,8 +71,7 @@ class CDSE(core.FetchModule):
         self.product_type = product_type
         self.max_cloud_cover = utils.float_or(cloud_cover)
 
-        w, e, s, n = self.region
-        self.aoi = f"POLYGON(({w} {s}, {e} {s}, {e} {n}, {w} {n}, {w} {s}))"
+        self.aoi = spatial.region_to_footprint(self.region)
 
         # Format Timestamps (Default to One year ago -> Today)
         if not end_date:
@@ -94,8 +101,19 @@ class CDSE(core.FetchModule):
     def headers(self, value):
         self._headers = value
 
+    def _set_token(self, token, expiry):
+        """Store the access token and update headers/expiry."""
+
+        self.access_token = token
+        self._token_expiry = expiry
+        self._headers = {"Authorization": f"Bearer {token}"}
+
     def refresh_token(self):
-        """Acquire a new token and update headers/expiry."""
+        """Acquire a new token and update headers/expiry.
+
+        Tokens are cached per username and reused until 30 seconds
+        before they expire.
+        """
 
         username, password = core.get_userpass(CDSE_AUTH_URL)
         if not username:
@@ -105,6 +123,18 @@ class CDSE(core.FetchModule):
             logger.warning("No credentials found in .netrc for CDSE.")
             return None
 
+        with _TOKEN_LOCK:
+            cached = _TOKEN_CACHE.get(username)
+            if cached is not None and time.time() < (cached[1] - 30):
+                logger.debug("Using cached CDSE access token.")
+                self._set_token(*cached)
+                return cached[0]
+
+            return self._request_token(username, password)
+
+    def _request_token(self, username, password):
+        """POST the password grant to the CDSE auth server."""
+
         data = {
             "client_id": "cdse-public",
             "grant_type": "password",
@@ -113,17 +143,18 @@ class CDSE(core.FetchModule):
         }
 
         try:
-            response = requests.post(CDSE_AUTH_URL, data=data)
+            response = core.get_session().post(CDSE_AUTH_URL, data=data)
             response.raise_for_status()
             json_resp = response.json()
 
             token = json_resp.get("access_token")
             expires_in = json_resp.get("expires_in", 600)
 
-            self.access_token = token
             # Set expiry time (current time + lifetime)
-            self._token_expiry = time.time() + int(expires_in)
-            self._headers = {"Authorization": f"Bearer {token}"}
+            expiry = time.time() + int(expires_in)
+            self._set_token(token, expiry)
+            if token:
+                _TOKEN_CACHE[username] = (token, expiry)
 
             logger.info(
                 f"Successfully retrieved CDSE access token (expires in {expires_in}s)."
@@ -152,7 +183,9 @@ class CDSE(core.FetchModule):
         url = initial_url
         for _ in range(10):
             # We use HEAD to resolve redirects without downloading the payload
-            req = requests.head(url, headers=self.headers, allow_redirects=False)
+            req = core.get_session().head(
+                url, headers=self.headers, allow_redirects=False
+            )
             if req.status_code in (301, 302, 303, 307):
                 url = req.headers["Location"]
             else:
@@ -200,7 +233,7 @@ class CDSE(core.FetchModule):
             logger.info(f"Fetching metadata page {page_count}...")
 
             try:
-                response_req = requests.get(query_url)
+                response_req = core.get_session().get(query_url)
                 response_req.raise_for_status()
                 response = response_req.json()
             except Exception as e:
@@ -221,7 +254,9 @@ class CDSE(core.FetchModule):
                     final_meta_url = self._resolve_redirects(meta_url)
 
                     # Fetch the XML Metadata
-                    meta_req = requests.get(final_meta_url, headers=self.headers)
+                    meta_req = core.get_session().get(
+                        final_meta_url, headers=self.headers
+                    )
                     if meta_req.status_code != 200:
                         continue
 
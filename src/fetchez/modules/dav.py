@@ -32,6 +32,7 @@ except ImportError:
 from fetchez import core
 from fetchez import utils
 from fetchez import cli
+from fetchez import spatial
 
 logger = logging.getLogger(__name__)
 
@@ -88,11 +89,9 @@ class DAV(core.FetchModule):
         if self.region is None:
             return None
 
-        w, e, s, n = self.region
-
         # Construct WKT Polygon (Counter-Clockwise)
         # DAV API expects SRID=4269 (NAD83)
-        poly = f"POLYGON(({w} {s}, {e} {s}, {e} {n}, {w} {n}, {w} {s}))"
+        poly = spatial.region_to_footprint(self.region)
         return f"SRID=4269;{poly}"
 
     def _get_features(self) -> List[Dict[Any, Any]]:
@@ -342,8 +341,7 @@ class DAV(core.FetchModule):
                         q=project_name,
                     )
 
-                    tnm_mod.run()
-                    self.results.extend(tnm_mod.results)
+                    self.results.extend(tnm_mod.iter_results())
 
                     continue
 
@@ -16,6 +16,7 @@ from typing import Optional
 from urllib.parse import urlencode
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 
 EMODNET_WCS_URL = "https://ows.emodnet-bathymetry.eu/wcs?"
 EMODNET_ERDDAP_BASE = (
@@ -89,7 +90,7 @@ class EMODNet(core.FetchModule):
 
             erddap_url = f"{EMODNET_ERDDAP_BASE}.{self.erddap_format}?{query}"
 
-            r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+            r_str = spatial.region_to_slug((w, e, s, n))
             # Include layer name in filename so they don't overwrite each other
             out_fn = f"emodnet_{self.layer}_{r_str}.{self.erddap_format}"
 
@@ -118,7 +119,7 @@ class EMODNet(core.FetchModule):
 
             full_url = f"{EMODNET_WCS_URL}{urlencode(wcs_params)}"
 
-            r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+            r_str = spatial.region_to_slug((w, e, s, n))
             out_fn = f"emodnet_{self.layer}_{r_str}.tif"
 
             self.add_entry_to_results(
@@ -14,6 +14,7 @@ Fetch Global Building Atlas (GBA) data via WFS.
 from urllib.parse import urlencode
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 
 GBA_WFS_URL = "https://tubvsig-so2sat-vm1.srv.mwn.de/geoserver/ows"
 
@@ -77,7 +78,7 @@ class GBA(core.FetchModule):
 
         full_url = f"{GBA_WFS_URL}?{urlencode(params)}"
 
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
         safe_layer = self.layer.replace(":", "_")
         out_fn = f"gba_{safe_layer}_{r_str}.{ext}"
 
@@ -14,6 +14,7 @@ Fetch Marine Gravity data from Scripps Institution of Oceanography (UCSD).
 from urllib.parse import urlencode
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 
 MARGRAV_CGI_URL = "https://topex.ucsd.edu/cgi-bin/get_data.cgi"
 # Note: This points to the global predicted topography grid derived from gravity
@@ -76,7 +77,7 @@ class MarGrav(core.FetchModule):
 
         full_url = f"{MARGRAV_CGI_URL}?{urlencode(data)}"
 
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
         out_fn = f"margrav_{r_str}.xyz"
 
         self.add_entry_to_results(
@@ -24,6 +24,13 @@ from fetchez import utils
 from fetchez import spatial
 from fetchez import cli
 
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 logger = logging.getLogger(__name__)
 
 # NOAA NCEI
@@ -69,6 +76,20 @@ def _parse_mbsystem_inf_bounds(
     return cast(tuple[float, float, float, float], minmax) if found else None
 
 
+def _iter_arcgis_features(req: requests.Response):
+    """Yield ArcGIS `features` from a streamed response as they arrive.
+
+    Uses ijson (if available) to parse the body incrementally, otherwise
+    falls back to parsing the whole response with `req.json()`.
+    """
+
+    if HAS_IJSON:
+        req.raw.decode_content = True
+        yield from ijson.items(req.raw, "features.item", use_float=True)
+    else:
+        yield from req.json().get("features", [])
+
+
 # =============================================================================
 # Multibeam Module (NCEI)
 # =============================================================================
@@ -339,10 +360,9 @@ class MBDB(core.FetchModule):
         if req is None:
             return []
 
-        features = req.json().get("features", [])
-        logger.info(f"MBDB found {len(features)} surveys.")
-
-        for feature in features:
+        n_features = 0
+        for feature in _iter_arcgis_features(req):
+            n_features += 1
             attrs = feature.get("attributes", {})
             download_url = attrs.get("DOWNLOAD_URL")
 
@@ -385,6 +405,8 @@ class MBDB(core.FetchModule):
                             data_type="mb_inf",
                             agency="NOAA NCEI",
                         )
+
+        logger.info(f"MBDB found {n_features} surveys.")
         return self
 
 
@@ -11,9 +11,9 @@ Fetch National Geodetic Survey (NGS) Monuments (Survey Marks) from NOAA.
 :license: MIT, see LICENSE for more details.
 """
 
-from urllib.parse import urlencode
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 
 NGS_SEARCH_URL = "https://geodesy.noaa.gov/api/nde/bounds?"
 
@@ -50,11 +50,10 @@ class NGS(core.FetchModule):
 
         w, e, s, n = self.region
 
-        params = {"minlon": w, "maxlon": e, "minlat": s, "maxlat": n}
+        # Bounds are always numeric, so no escaping is needed.
+        full_url = f"{NGS_SEARCH_URL}minlon={w}&maxlon={e}&minlat={s}&maxlat={n}"
 
-        full_url = f"{NGS_SEARCH_URL}{urlencode(params)}"
-
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
         out_fn = f"ngs_monuments_{r_str}.json"
 
         self.add_entry_to_results(
@@ -11,9 +11,10 @@ Fetch New South Wales (NSW) Topo-Bathy data via ArcGIS REST API.
 :license: MIT, see LICENSE for more details.
 """
 
-from urllib.parse import urlencode
+from urllib.parse import quote
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 
 NSW_MAP_SERVER = (
     "https://mapprod2.environment.nsw.gov.au/arcgis/rest/services/"
@@ -60,22 +61,16 @@ class NSWTB(core.FetchModule):
         w, e, s, n = self.region
 
         # For DEMs, we might need an 'export' operation.
-        params = {
-            "where": self.where,
-            "outFields": "*",
-            "geometry": f"{w},{s},{e},{n}",
-            "geometryType": "esriGeometryEnvelope",
-            "spatialRel": "esriSpatialRelIntersects",
-            "inSR": "4326",
-            "outSR": "4326",
-            "f": "geojson",
-            "returnGeometry": "true",
-        }
-
+        # Only the user-supplied `where` clause needs escaping.
         base_query_url = f"{NSW_MAP_SERVER}/{self.layer}/query"
-        full_url = f"{base_query_url}?{urlencode(params)}"
+        full_url = (
+            f"{base_query_url}?where={quote(self.where)}&outFields=*"
+            f"&geometry={w},{s},{e},{n}&geometryType=esriGeometryEnvelope"
+            "&spatialRel=esriSpatialRelIntersects&inSR=4326&outSR=4326"
+            "&f=geojson&returnGeometry=true"
+        )
 
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
         layer_name = {0: "contours", 1: "slope", 2: "dem"}.get(
             self.layer, f"layer{self.layer}"
         )
@@ -155,8 +155,8 @@ class OSM(core.FetchModule):
 
             w, e, s, n = chunk
             # r_str = f"w{w:.2f}_n{n:.2f}".replace(".", "p").replace("-", "m")
-            r_str = f"w{w:.2f}_e{e:.2f}_s{s:.2f}_n{n:.2f}".replace(".", "p").replace(
-                "-", "m"
+            r_str = f"w{w:.2f}_e{e:.2f}_s{s:.2f}_n{n:.2f}".translate(
+                spatial.REGION_SLUG_TABLE
             )
             out_fn = f"osm_{self.file_tag}_{r_str}.osm"
 
@@ -31,6 +31,17 @@ logger = logging.getLogger(__name__)
 PROJ_CDN_INDEX_URL = "https://cdn.proj.org/files.geojson"
 
 
+def _epsg_code(value) -> Optional[int]:
+    """Parse an EPSG code such as `4326` or `"EPSG:4326"` into an int."""
+
+    if value is None:
+        return None
+    try:
+        return int(str(value).rsplit(":", 1)[-1])
+    except ValueError:
+        return None
+
+
 @cli.cli_opts(
     help_text="PROJ CDN Transformation Grids",
     query='Search term (e.g., "geoid18", "vertcon", "nadcon").',
@@ -51,7 +62,9 @@ class PROJ(core.FetchModule):
     ):
         super().__init__(name="proj", **kwargs)
         self.query = query.lower() if query else None
-        self.epsg = str(epsg) if epsg else None
+        self.epsg = _epsg_code(epsg) if epsg else None
+        # Kept so run() can refuse an unparsable code rather than ignore it
+        self._bad_epsg = epsg if epsg and self.epsg is None else None
         self.headers = {"User-Agent": "Fetchez/1.0 (PROJ-Compatible)"}
 
     def _intersects(self, grid_geom, grid_bbox=None):
@@ -90,6 +103,10 @@ class PROJ(core.FetchModule):
     #     return not (rw > ge or re < gw or rs > gn or rn < gs)
 
     def run(self):
+        if self._bad_epsg:
+            logger.error(f"Invalid EPSG code: {self._bad_epsg}")
+            return self
+
         idx_file = os.path.join(self._outdir, "proj_files.geojson")
 
         if not os.path.exists(idx_file):
@@ -118,12 +135,12 @@ class PROJ(core.FetchModule):
                     if self.query not in text:
                         continue
 
-                if self.epsg:
-                    s, t = (
-                        str(props.get("source_crs_code")),
-                        str(props.get("target_crs_code")),
-                    )
-                    if self.epsg not in s and self.epsg not in t:
+                if self.epsg is not None:
+                    # Compare integer codes; the index stores "EPSG:XXXX" strings.
+                    if self.epsg not in (
+                        _epsg_code(props.get("source_crs_code")),
+                        _epsg_code(props.get("target_crs_code")),
+                    ):
                         continue
 
                 self.add_entry_to_results(
@@ -11,10 +11,12 @@ Includes Smart-Fallback bridging for Legacy SciHub and Modern CDSE endpoints.
 
 import os
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import threading
+from typing import Optional, Dict, Tuple, Any
 from fetchez import core
 from fetchez import cli
+from fetchez import utils
+from fetchez import spatial
 
 try:
     from sentinelsat import SentinelAPI
@@ -31,6 +33,27 @@ CDSE_ODATA_URL = "https://catalogue.dataspace.copernicus.eu/odata/v1"
 # Legacy SciHub Facade (Works on older sentinelsat versions)
 LEGACY_API_URL = "https://apihub.copernicus.eu/apihub"
 
+# SentinelAPI clients (and their HTTP sessions) are reused across runs,
+# keyed by (username, api_url). Kept per thread, since modules run
+# concurrently and a requests.Session is not thread-safe.
+_THREAD_LOCAL = threading.local()
+
+
+def _get_api(username: str, password: str, api_url: str, **kwargs):
+    """Return this thread's cached `SentinelAPI` client for this user and endpoint."""
+
+    api_cache: Optional[Dict[Tuple[str, str], Any]] = getattr(
+        _THREAD_LOCAL, "api_cache", None
+    )
+    if api_cache is None:
+        api_cache = _THREAD_LOCAL.api_cache = {}
+
+    key = (username, api_url)
+    api = api_cache.get(key)
+    if api is None:
+        api = api_cache[key] = SentinelAPI(username, password, api_url, **kwargs)
+    return api
+
 
 @cli.cli_opts(
     help_text="Copernicus Sentinel-2 Imagery",
@@ -75,24 +98,23 @@ class Sentinel2(core.FetchModule):
             return self
 
         if not self.start_date:
-            self.start_date = (datetime.now() - timedelta(days=30)).strftime("%Y%m%d")
+            self.start_date = utils.yyyymmdd(days_ago=30)
         else:
             self.start_date = self.start_date.replace("-", "")
 
         if not self.end_date:
-            self.end_date = datetime.now().strftime("%Y%m%d")
+            self.end_date = utils.yyyymmdd()
         else:
             self.end_date = self.end_date.replace("-", "")
 
-        w, e, s, n = self.region
-        footprint = f"POLYGON(({w} {s}, {e} {s}, {e} {n}, {w} {n}, {w} {s}))"
+        footprint = spatial.region_to_footprint(self.region)
 
         products = None
         api = None
 
         try:
             # Attempt Modern CDSE OData API
-            api = SentinelAPI(username, password, CDSE_ODATA_URL)
+            api = _get_api(username, password, CDSE_ODATA_URL)
             products = api.query(
                 footprint,
                 date=(self.start_date, self.end_date),
@@ -109,7 +131,7 @@ class Sentinel2(core.FetchModule):
             try:
                 # Fallback to Legacy
                 logger.info("Falling back to Legacy Copernicus endpoint...")
-                api = SentinelAPI(username, password, LEGACY_API_URL, timeout=120)
+                api = _get_api(username, password, LEGACY_API_URL, timeout=120)
                 products = api.query(
                     footprint,
                     date=(self.start_date, self.end_date),
@@ -14,6 +14,7 @@ Fetch SRTM15+ Global Bathymetry and Topography from Scripps Institution of Ocean
 from urllib.parse import urlencode
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 
 SRTM_PLUS_CGI_URL = "https://topex.ucsd.edu/cgi-bin/get_srtm15.cgi"
 
@@ -56,7 +57,7 @@ class SRTMPlus(core.FetchModule):
 
         full_url = f"{SRTM_PLUS_CGI_URL}?{urlencode(data)}"
 
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
         out_fn = f"srtm_{r_str}.xyz"
 
         self.add_entry_to_results(
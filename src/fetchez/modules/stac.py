@@ -17,7 +17,9 @@ Dependencies:
 
 import os
 import logging
-from fetchez import core, cli
+import threading
+import concurrent.futures
+from fetchez import core, cli, spatial
 
 try:
     import pystac_client
@@ -28,6 +30,61 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Opened STAC clients, keyed by API URL, so the root catalog and
+# conformance classes are only fetched once per thread. Clients wrap a
+# requests.Session, so each worker thread keeps its own (see core.get_session).
+_THREAD_LOCAL = threading.local()
+
+# Asset keys to try (in order) when no `assets` are requested.
+FALLBACK_ASSET_KEYS = ("visual", "data", "analytic")
+
+
+def _default_asset_keys(assets):
+    """Return the first available fallback asset key, or all asset keys."""
+
+    for key in FALLBACK_ASSET_KEYS:
+        if key in assets:
+            return (key,)
+    return tuple(assets)
+
+
+def _open_client(api_url):
+    """Return this thread's cached `pystac_client.Client` for `api_url`."""
+
+    clients = getattr(_THREAD_LOCAL, "clients", None)
+    if clients is None:
+        clients = _THREAD_LOCAL.clients = {}
+
+    client = clients.get(api_url)
+    if client is None:
+        client = clients[api_url] = pystac_client.Client.open(api_url)
+    return client
+
+
+def _prefetch_pages(pages):
+    """Yield STAC result pages while the next page is fetched in the background.
+
+    Pagination follows `next` links, so pages still arrive one at a time,
+    but the request for page N+1 overlaps with processing page N.
+    """
+
+    pages = iter(pages)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, pages, None)
+        while True:
+            page = future.result()
+            if page is None:
+                return
+            future = executor.submit(next, pages, None)
+            yield page
+
+
+def _item_date(item):
+    """Return the item datetime as YYYYMMDD (or 'nodate') from the raw dict."""
+
+    dt = (item.get("properties") or {}).get("datetime")
+    return dt[:10].replace("-", "") if dt else "nodate"
+
 
 @cli.cli_opts(
     help_text="Fetch data from a STAC API.",
@@ -61,25 +118,19 @@ class STACModule(core.FetchModule):
         self.cloud_cover = float(cloud_cover) if cloud_cover is not None else None
         self.limit = int(limit) if limit else 500
 
-    def run(self):
-        if not HAS_STAC:
-            logger.error(
-                "STACModule requires 'pystac-client'. Install it with: pip install pystac-client"
-            )
-            return
+    def _search(self, **geometry):
+        """Search the STAC API and queue the matching assets.
 
-        if not self.region:
-            logger.error("Region is required for STAC search.")
-            return
+        `geometry` is passed straight to `client.search`, i.e. either
+        `bbox=(w, s, e, n)` or `intersects=<GeoJSON geometry>`.
+        """
 
         logger.info(f"Querying STAC API: {self.api_url}")
 
         try:
-            client = pystac_client.Client.open(self.api_url)
-            # w, e, s, n = self.reigon
-            # bbox = (w, s, e, n)
+            client = _open_client(self.api_url)
             search_params = {
-                "bbox": self.region,
+                **geometry,
                 "max_items": self.limit,
             }
 
@@ -93,55 +144,81 @@ class STACModule(core.FetchModule):
                 search_params["query"] = {"eo:cloud_cover": {"lt": self.cloud_cover}}
 
             search = client.search(**search_params)
-            items = list(search.items())
 
-            if not items:
+            # Queue each page's assets as it arrives, while the next page is
+            # being fetched. Use the raw item dicts; building pystac Item
+            # objects for every result is wasted work when we only need hrefs.
+            asset_keys = self.asset_keys
+            n_items = count = 0
+            for page in _prefetch_pages(search.pages_as_dicts()):
+                for item in page.get("features", []):
+                    n_items += 1
+                    assets = item.get("assets") or {}
+                    date_str = _item_date(item)
+                    stem = f"{item.get('collection')}_{date_str}_{item['id']}"
+                    for key in asset_keys or _default_asset_keys(assets):
+                        if key not in assets:
+                            continue
+
+                        href = assets[key]["href"]
+                        ext = os.path.splitext(href)[1] or ".tif"
+                        self.add_entry_to_results(
+                            url=href,
+                            dst_fn=f"{stem}_{key}{ext}",
+                            data_type="raster",
+                            stac_id=item["id"],
+                            stac_date=date_str,
+                        )
+                        count += 1
+
+            if not n_items:
                 logger.warning("No items found matching criteria.")
                 return
 
-            logger.info(f"Found {len(items)} STAC items.")
-
-            count = 0
-            for item in items:
-                keys_to_fetch = self.asset_keys
-
-                if not keys_to_fetch:
-                    available = item.assets.keys()
-                    if "visual" in available:
-                        keys_to_fetch = ["visual"]
-                    elif "data" in available:
-                        keys_to_fetch = ["data"]
-                    elif "analytic" in available:
-                        keys_to_fetch = ["analytic"]
-                    else:
-                        keys_to_fetch = list(available)
-
-                for key in keys_to_fetch:
-                    if key not in item.assets:
-                        continue
-
-                    asset = item.assets[key]
-                    href = asset.href
-
-                    date_str = (
-                        item.datetime.strftime("%Y%m%d") if item.datetime else "nodate"
-                    )
-                    ext = os.path.splitext(href)[1]
-                    if not ext:
-                        ext = ".tif"
-
-                    dst_fn = f"{item.collection_id}_{date_str}_{item.id}_{key}{ext}"
-
-                    self.add_entry_to_results(
-                        url=href,
-                        dst_fn=dst_fn,
-                        data_type="raster",
-                        stac_id=item.id,
-                        stac_date=date_str,
-                    )
-                    count += 1
-
+            logger.info(f"Found {n_items} STAC items.")
             logger.info(f"Queued {count} assets for download.")
 
         except Exception as e:
             logger.error(f"STAC Query failed: {e}", exc_info=True)
+
+    def run(self):
+        if not HAS_STAC:
+            logger.error(
+                "STACModule requires 'pystac-client'. Install it with: pip install pystac-client"
+            )
+            return
+
+        if not self.region:
+            logger.error("Region is required for STAC search.")
+            return
+
+        # fetchez regions are (w, e, s, n); STAC bboxes are (w, s, e, n)
+        self._search(bbox=spatial.region_to_bbox(self.region))
+
+    def run_batch(self, regions):
+        """Search many regions with a single STAC request.
+
+        The regions are combined into one MultiPolygon `intersects` query,
+        so N tiles cost one search (and its pages) instead of N searches.
+        Items covering several regions are only returned (and queued) once.
+        """
+
+        if not HAS_STAC:
+            logger.error(
+                "STACModule requires 'pystac-client'. Install it with: pip install pystac-client"
+            )
+            return self
+
+        if not regions:
+            logger.error("Regions are required for STAC search.")
+            return self
+
+        multipolygon = {
+            "type": "MultiPolygon",
+            "coordinates": [
+                spatial.region_to_geojson_geom(region)["coordinates"]
+                for region in regions
+            ],
+        }
+        self._search(intersects=multipolygon)
+        return self
@@ -23,6 +23,8 @@ SYNBATH_URL = "https://topex.ucsd.edu/pub/synbath/SYNBATH_V2.0.nc"
 # =============================================================================
 @cli.cli_opts(
     help_text="UCSD SynBath Global Bathymetry (Geologically Constrained)",
+    parallel="Number of concurrent range requests for the download. Default: 8",
+    chunk_size_mb="Size (MB) of each range request. Default: 64",
 )
 class SynBath(core.FetchModule):
     """Fetch the UCSD SynBath (Synthetic Bathymetry) dataset.
@@ -34,13 +36,34 @@ class SynBath(core.FetchModule):
 
     **Note:** This module downloads the full global grid (~6.2 GB).
     There is currently no regional subsetting service available for SynBath.
+    The grid is fetched with concurrent HTTP range requests (see `parallel`).
 
     References:
       - https://topex.ucsd.edu/pub/synbath/SYNBATH_publication.pdf
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, parallel: int = 8, chunk_size_mb: int = 64, **kwargs):
         super().__init__(name="synbath", **kwargs)
+        self.parallel = int(parallel)
+        self.chunk_size_mb = int(chunk_size_mb)
+
+    def fetch_entry(self, entry, check_size=True, retries=5, verbose=True):
+        """Fetch the (large) SynBath grid with parallel range requests."""
+
+        try:
+            status = core.Fetch(
+                url=entry["url"],
+                headers=self.headers,
+            ).fetch_file_parallel(
+                entry["dst_fn"],
+                parallel=self.parallel,
+                chunk_size=self.chunk_size_mb * 1024 * 1024,
+                tries=retries,
+                verbose=verbose,
+            )
+        except Exception:
+            status = -1
+        return status
 
     def run(self):
         """Run the SynBath fetching logic."""
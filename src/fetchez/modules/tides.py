@@ -16,14 +16,28 @@ Supports two modes:
 """
 
 from urllib.parse import urlencode
-from datetime import datetime, timedelta
 from typing import Optional
 from fetchez import core
 from fetchez import cli
+from fetchez import utils
+from fetchez import spatial
 
 # Service for finding stations (ArcGIS REST)
 STATION_SEARCH_URL = "https://mapservices.weather.noaa.gov/static/rest/services/NOS_Observations/CO_OPS_Products/FeatureServer/0/query?"
 
+# Invariant part of the station search query; only the geometry changes.
+STATION_SEARCH_PARAMS = urlencode(
+    {
+        "outFields": "*",
+        "units": "esriSRUnit_Meter",
+        "geometryType": "esriGeometryEnvelope",
+        "spatialRel": "esriSpatialRelIntersects",
+        "inSR": 4326,
+        "outSR": 4326,
+        "f": "geojson",
+    }
+)
+
 # Service for fetching data (CO-OPS API)
 DATA_API_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter?"
 
@@ -33,12 +47,13 @@ DATA_API_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter?"
 # =============================================================================
 @cli.cli_opts(
     help_text="NOAA CO-OPS Tides & Currents",
-    station="Station ID (e.g. 8518750). If provided, fetches DATA. If omitted, searches REGION.",
+    station="Station ID(s), '/' separated (e.g. 8518750/8516945). If provided, fetches DATA. If omitted, searches REGION.",
     start_date="Start Date (YYYYMMDD). Required for data mode.",
     end_date="End Date (YYYYMMDD). Required for data mode.",
     datum="Vertical Datum (MLLW, MSL, NAVD88, STND). Default: MLLW",
     product="Product (water_level, predictions, air_temperature, wind). Default: water_level",
     interval="Data Interval (h, hilo). Default: h (Hourly) for data, None for 6-min.",
+    search="Also search REGION for stations when fetching station data.",
 )
 class Tides(core.FetchModule):
     """Fetch NOAA Tides & Currents data.
@@ -47,7 +62,9 @@ class Tides(core.FetchModule):
       Searches the provided region for active tide stations and saves a GeoJSON list.
 
     Mode: Data Retrieval (Default if --station provided)
-      Downloads time-series data for the specific station.
+      Downloads time-series data for the specific station(s).
+      Add --search to also queue the station list for the region, so
+      discovery and data retrieval download together in one run.
 
     References:
       - https://tidesandcurrents.noaa.gov/
@@ -62,6 +79,7 @@ class Tides(core.FetchModule):
         datum: str = "MLLW",
         product: str = "water_level",
         interval: Optional[str] = None,
+        search: bool = False,
         **kwargs,
     ):
         super().__init__(name="tides", **kwargs)
@@ -71,6 +89,7 @@ class Tides(core.FetchModule):
         self.datum = datum
         self.product = product
         self.interval = interval
+        self.search = search
 
     def _run_station_search(self):
         """Search for stations in the region."""
@@ -80,20 +99,11 @@ class Tides(core.FetchModule):
 
         w, e, s, n = self.region
 
-        params = {
-            "outFields": "*",
-            "units": "esriSRUnit_Meter",
-            "geometry": f"{w},{s},{e},{n}",
-            "geometryType": "esriGeometryEnvelope",
-            "spatialRel": "esriSpatialRelIntersects",
-            "inSR": 4326,
-            "outSR": 4326,
-            "f": "geojson",
-        }
-
-        full_url = f"{STATION_SEARCH_URL}{urlencode(params)}"
+        full_url = (
+            f"{STATION_SEARCH_URL}{STATION_SEARCH_PARAMS}&geometry={w},{s},{e},{n}"
+        )
 
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
         out_fn = f"tides_stations_{r_str}.geojson"
 
         self.add_entry_to_results(
@@ -104,18 +114,17 @@ class Tides(core.FetchModule):
             title="Tide Stations List",
         )
 
-    def _run_data_fetch(self):
+    def _run_data_fetch(self, station):
         """Fetch time-series data for a station."""
-        if not self.start_date or not self.end_date:
-            # Default to last 24 hours if not specified
-            now = datetime.utcnow()
-            if not self.end_date:
-                self.end_date = now.strftime("%Y%m%d")
-            if not self.start_date:
-                self.start_date = (now - timedelta(days=1)).strftime("%Y%m%d")
+
+        # Default to last 24 hours if not specified
+        if not self.end_date:
+            self.end_date = utils.yyyymmdd(utc=True)
+        if not self.start_date:
+            self.start_date = utils.yyyymmdd(days_ago=1, utc=True)
 
         params = {
-            "station": self.station,
+            "station": station,
             "begin_date": self.start_date,
             "end_date": self.end_date,
             "product": self.product,
@@ -133,23 +142,29 @@ class Tides(core.FetchModule):
         full_url = f"{DATA_API_URL}{urlencode(params)}"
 
         # Output: tides_8518750_water_level_20230101_20230107.csv
-        out_fn = (
-            f"tides_{self.station}_{self.product}_{self.start_date}_{self.end_date}.csv"
-        )
+        out_fn = f"tides_{station}_{self.product}_{self.start_date}_{self.end_date}.csv"
 
         self.add_entry_to_results(
             url=full_url,
             dst_fn=out_fn,
             data_type="csv",
             agency="NOAA CO-OPS",
-            title=f"Station {self.station} Data",
+            title=f"Station {station} Data",
         )
 
     def run(self):
         """Run the TIDES fetching module."""
 
+        # Every entry is queued here and downloaded concurrently by the
+        # fetch workers, so multiple stations (and the optional station
+        # search) cost no extra sequential round-trips.
         if self.station:
-            self._run_data_fetch()
+            for station in str(self.station).split("/"):
+                if station.strip():
+                    self._run_data_fetch(station.strip())
+
+            if self.search and self.region:
+                self._run_station_search()
         elif self.region:
             self._run_station_search()
 
@@ -11,11 +11,17 @@ Fetch US Census Bureau TIGER data (Boundaries) via the TIGERweb REST API.
 :license: MIT, see LICENSE for more details.
 """
 
+import os
+import json
+import time
 import logging
-from urllib.parse import urlencode
+from urllib.parse import urlencode, quote_plus
 
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
+from fetchez import config
+from fetchez import utils
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,27 @@ logger = logging.getLogger(__name__)
 # but "tigerWMS_Current" is the main boundary service.
 TIGER_BASE_URL = "https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/tigerWMS_Current/MapServer"
 
+# Invariant part of the layer query; only `where` and the geometry change.
+QUERY_PARAMS = urlencode(
+    {
+        "f": "geojson",
+        "outFields": "*",
+        "geometryType": "esriGeometryEnvelope",
+        "spatialRel": "esriSpatialRelIntersects",
+        "inSR": "4326",  # Input Region is WGS84
+        "outSR": "4326",  # Output GeoJSON should be WGS84
+    }
+)
+
+# Features per page when a query has to be split. This is at or below the
+# maxRecordCount of the TIGERweb layers, so pages are never truncated.
+PAGE_SIZE = 1000
+
+# Layer name/id metadata is cached on disk and refreshed after a week
+# (or when `check_meta` is set).
+LAYER_CACHE_FILE = os.path.join(config.CONFIG_PATH, "cache", "tiger_layers.json")
+LAYER_CACHE_TTL = 7 * 24 * 60 * 60
+
 
 # =============================================================================
 # TIGER Module
@@ -63,34 +90,87 @@ class Tiger(core.FetchModule):
         self.check_meta = check_meta
         self._layer_id = None
 
+    def _load_layer_cache(self):
+        """Load the cached layer list, if it exists and is still fresh."""
+
+        if self.check_meta or not os.path.exists(LAYER_CACHE_FILE):
+            return None
+
+        if time.time() - os.path.getmtime(LAYER_CACHE_FILE) > LAYER_CACHE_TTL:
+            return None
+
+        try:
+            with open(LAYER_CACHE_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read TIGERweb layer cache: {e}")
+            return None
+
+    def _save_layer_cache(self, layers):
+        """Write the layer list to the cache file atomically."""
+
+        try:
+            utils.write_atomic(LAYER_CACHE_FILE, json.dumps(layers))
+        except OSError as e:
+            logger.debug(f"Could not write TIGERweb layer cache: {e}")
+
+    def _fetch_layers(self):
+        """Fetch the layer list from the TIGERweb service metadata."""
+
+        meta_url = f"{TIGER_BASE_URL}?f=json"
+        req = core.get_session().get(meta_url, headers=core.R_HEADERS, timeout=10)
+        if not req or req.status_code != 200:
+            logger.error("Failed to fetch TIGERweb metadata.")
+            return None
+
+        layers = [
+            {"name": layer["name"], "id": layer["id"]}
+            for layer in utils.json_loads(req.content).get("layers", [])
+        ]
+        self._save_layer_cache(layers)
+        return layers
+
+    def _match_layer_id(self, layers, layer_name):
+        """Match `layer_name` against the layer list (exact, then partial)."""
+
+        clean_name = layer_name.lower().strip()
+        # Keep the first id for duplicate names, as the old linear scan did.
+        name_map = {}
+        for layer in layers:
+            name_map.setdefault(layer["name"].lower().strip(), layer["id"])
+
+        if clean_name in name_map:
+            return name_map[clean_name]
+
+        for name, layer_id in name_map.items():
+            if clean_name in name:
+                logger.info(
+                    f"Matched layer '{layer_name}' to '{name}' (ID: {layer_id})"
+                )
+                return layer_id
+
+        return None
+
     def _get_layer_id(self, layer_name):
         """Find the Layer ID by name from the service metadata.
         TIGERweb layer IDs can change, so we lookup by name.
         """
 
-        meta_url = f"{TIGER_BASE_URL}?f=json"
-
         try:
-            req = core.Fetch(meta_url).fetch_req()
-            if not req or req.status_code != 200:
-                logger.error("Failed to fetch TIGERweb metadata.")
+            layers = self._load_layer_cache()
+            if layers is not None:
+                layer_id = self._match_layer_id(layers, layer_name)
+                if layer_id is not None:
+                    return layer_id
+
+            # Cache miss, stale cache or unknown name; refresh the metadata.
+            layers = self._fetch_layers()
+            if layers is None:
                 return None
 
-            data = req.json()
-            layers = data.get("layers", [])
-
-            clean_name = layer_name.lower().strip()
-
-            for layer in layers:
-                if layer["name"].lower().strip() == clean_name:
-                    return layer["id"]
-
-            for layer in layers:
-                if clean_name in layer["name"].lower():
-                    logger.info(
-                        f"Matched layer '{layer_name}' to '{layer['name']}' (ID: {layer['id']})"
-                    )
-                    return layer["id"]
+            layer_id = self._match_layer_id(layers, layer_name)
+            if layer_id is not None:
+                return layer_id
 
             avail = [layer["name"] for layer in layers[:10]]  # Show first 10
             logger.error(
@@ -102,8 +182,27 @@ class Tiger(core.FetchModule):
             logger.error(f"Error looking up layer ID: {e}")
             return None
 
+    def _feature_count(self, full_url):
+        """Preflight the query with `returnCountOnly` to get the feature count."""
+
+        try:
+            req = core.get_session().get(
+                f"{full_url}&returnCountOnly=true", headers=core.R_HEADERS, timeout=10
+            )
+            if req.status_code != 200:
+                return None
+            return utils.int_or(utils.json_loads(req.content).get("count"))
+        except Exception as e:
+            logger.debug(f"TIGERweb count query failed: {e}")
+            return None
+
     def run(self):
-        """Run the TIGER fetching logic."""
+        """Run the TIGER fetching logic.
+
+        Large queries are split into `resultOffset` pages up front (from a
+        count preflight) so the pages download concurrently on the shared
+        fetch workers instead of being discovered one after another.
+        """
 
         if self.region is None:
             return []
@@ -118,29 +217,37 @@ class Tiger(core.FetchModule):
 
         w, e, s, n = self.region
 
-        params = {
-            "f": "geojson",
-            "where": self.where,
-            "outFields": "*",
-            "geometry": f"{w},{s},{e},{n}",
-            "geometryType": "esriGeometryEnvelope",
-            "spatialRel": "esriSpatialRelIntersects",
-            "inSR": "4326",  # Input Region is WGS84
-            "outSR": "4326",  # Output GeoJSON should be WGS84
-        }
-
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
         safe_layer = self.layer_name.replace(" ", "_").lower()
         out_fn = f"tiger_{safe_layer}_{r_str}.geojson"
 
-        full_url = f"{query_url}?{urlencode(params, safe=',:')}"
-
-        self.add_entry_to_results(
-            url=full_url,
-            dst_fn=out_fn,
-            data_type="geojson",
-            agency="US Census Bureau",
-            title=f"TIGER {self.layer_name}",
+        full_url = (
+            f"{query_url}?{QUERY_PARAMS}&where={quote_plus(self.where, safe=',:')}"
+            f"&geometry={w},{s},{e},{n}"
         )
 
+        count = self._feature_count(full_url)
+        if count is None or count <= PAGE_SIZE:
+            self.add_entry_to_results(
+                url=full_url,
+                dst_fn=out_fn,
+                data_type="geojson",
+                agency="US Census Bureau",
+                title=f"TIGER {self.layer_name}",
+            )
+            return self
+
+        logger.info(f"Splitting {count} TIGER features into pages of {PAGE_SIZE}.")
+        for page, offset in enumerate(range(0, count, PAGE_SIZE)):
+            self.add_entry_to_results(
+                url=(
+                    f"{full_url}&orderByFields=OBJECTID"
+                    f"&resultOffset={offset}&resultRecordCount={PAGE_SIZE}"
+                ),
+                dst_fn=f"tiger_{safe_layer}_{r_str}_p{page}.geojson",
+                data_type="geojson",
+                agency="US Census Bureau",
+                title=f"TIGER {self.layer_name} (page {page + 1})",
+            )
+
         return self
@@ -12,6 +12,10 @@ Fetch elevation data from The National Map (TNM) API.
 """
 
 import logging
+import functools
+import itertools
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from fetchez import core
@@ -19,11 +23,23 @@ from fetchez import utils
 from fetchez import spatial
 from fetchez import cli
 
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 logger = logging.getLogger(__name__)
 
 TNM_API_PRODUCTS_URL = "https://tnmaccess.nationalmap.gov/api/v1/products?"
+PAGE_SIZE = 100
+MAX_WORKERS = 8
+
+# TNM error responses start with an errorMessage key (sometimes unquoted)
+ERROR_PREFIXES = (b"{errorMessage", b'{"errorMessage')
 
-DATASET_CODES = [
+DATASET_CODES = (
     "National Boundary Dataset (NBD)",
     "National Elevation Dataset (NED) 1 arc-second",
     "Digital Elevation Model (DEM) 1 meter",
@@ -53,7 +69,82 @@ DATASET_CODES = [
     "US Topo Historical",
     "Land Cover - Woodland",
     "3D Hydrography Program (3DHP)",
-]
+)
+
+# Map NED resolution strings to TNM Dataset Indices
+# 1 = NED 1 arc-sec
+# 2 = DEM 1 meter
+# 3 = NED 1/3 arc-sec
+NED_RES_DATASETS = {
+    "13": "1/3",  # Standard seamless (Old Default)
+    "1m": "2",  # High res
+    "1": "1",  # Coarse
+    "1/3": "3",  # Standard
+    "all": "1/2/3",  # Everything
+}
+
+
+class _HeadStream:
+    """File-like reader that replays already-read `head` bytes before `raw`."""
+
+    def __init__(self, head, raw):
+        self.head = head
+        self.raw = raw
+
+    def read(self, size=-1):
+        if not self.head:
+            return self.raw.read(size if size >= 0 else None)
+
+        data, self.head = self.head, b""
+        if size < 0:
+            return data + self.raw.read()
+        if len(data) >= size:
+            data, self.head = data[:size], data[size:]
+            return data
+        return data + self.raw.read(size - len(data))
+
+
+def _iter_items(req, page):
+    """Yield the `items` of a streamed TNM response as they are parsed.
+
+    The page `total` (or the `errorMessage` body) is recorded in the `page` dict.
+    Uses ijson (if available) so only one item is materialized at a time,
+    otherwise falls back to parsing the whole response at once.
+    """
+
+    if not HAS_IJSON:
+        content = req.content
+        if content[:64].lstrip().startswith(ERROR_PREFIXES):
+            page["error"] = content.decode("utf-8", errors="replace")
+            return
+
+        data = utils.json_loads(content)
+        page["total"] = data.get("total", 0)
+        yield from data.get("items", [])
+        return
+
+    # Sniff the first bytes of the stream for an error body without reading
+    # (or decoding) the rest of it.
+    req.raw.decode_content = True
+    head = req.raw.read(64)
+    if head.lstrip().startswith(ERROR_PREFIXES):
+        page["error"] = (head + req.raw.read()).decode("utf-8", errors="replace")
+        return
+
+    stream = _HeadStream(head, req.raw)
+
+    builder = None
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "items.item" and event == "end_map":
+                yield builder.value
+                builder = None
+        elif prefix == "items.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "total":
+            page["total"] = value
 
 
 # =============================================================================
@@ -102,20 +193,104 @@ class TheNationalMap(core.FetchModule):
         self.date_start = date_start
         self.date_end = date_end
 
+    def _base_params(self, bbox_str, dataset_names):
+        """Build the query params shared by every page of a search."""
+
+        params = {
+            "bbox": bbox_str,
+            "max": PAGE_SIZE,
+            "datasets": ",".join(dataset_names),
+        }
+
+        if self.q:
+            params["q"] = str(self.q)
+        if self.formats:
+            params["prodFormats"] = self.formats.replace("/", ",")
+        if self.extents:
+            params["prodExtents"] = self.extents.replace("/", ",")
+
+        if self.date_start:
+            params["start"] = self.date_start
+            params["end"] = (
+                self.date_end if self.date_end else utils.this_date()[:8]
+            )  # YYYYMMDD
+            params["dateType"] = self.date_type
+
+        return params
+
+    def _fetch_page(self, base_params, offset):
+        """Fetch and parse one page of TNM products.
+
+        Returns a tuple of (total, entries), where `entries` are the keyword
+        arguments for `make_entry`. `total` is None on failure.
+        """
+
+        req = core.Fetch(TNM_API_PRODUCTS_URL).fetch_req(
+            params={**base_params, "offset": offset}, timeout=60, read_timeout=60
+        )
+
+        if req is None or req.status_code != 200:
+            logger.error(f"TNM API Failed: {req.status_code if req else 'No Response'}")
+            return None, []
+
+        page = {"total": 0}
+        entries = []
+        try:
+            for item in _iter_items(req, page):
+                url = item.get("downloadURL")
+                if not url:
+                    continue
+
+                item_bbox = item.get("boundingBox", {})
+                bounds = None
+                if item_bbox:
+                    bounds = (
+                        item_bbox.get("minX"),
+                        item_bbox.get("maxX"),
+                        item_bbox.get("minY"),
+                        item_bbox.get("maxY"),
+                    )
+
+                entries.append(
+                    {
+                        "url": url,
+                        "dst_fn": url.split("/")[-1],
+                        "data_type": "tnm",
+                        "format": item.get("format", "Unknown"),
+                        "bounds": bounds,
+                        "date": item.get("publicationDate"),
+                        "remote_size": item.get("sizeInBytes"),
+                        "title": item.get("title"),
+                    }
+                )
+
+        except Exception as e:
+            logger.error(f"Error parsing TNM JSON: {e}")
+            return None, entries
+
+        if "error" in page:
+            logger.error(f"TNM API Error: {page['error']}")
+            return None, []
+
+        return page["total"], entries
+
     def run(self):
         """Run the TNM fetching module."""
 
+        self.results.extend(self.iter_results())
+        return self
+
+    def iter_results(self):
+        """Yield TNM entries page by page, with at most MAX_WORKERS pages in flight."""
+
         if self.region is None or not spatial.region_valid_p(self.region):
-            return []
+            return
 
         # Convert region tuple to string for API: "xmin,ymin,xmax,ymax"
         # Note: TNM uses comma-separated bbox
         w, e, s, n = self.region
         bbox_str = f"{w},{s},{e},{n}"
 
-        offset = 0
-        total = 0
-
         # Determine Datasets to query
         dataset_names = []
         if self.datasets is not None:
@@ -133,85 +308,46 @@ class TheNationalMap(core.FetchModule):
         if not dataset_names:
             dataset_names = ["National Elevation Dataset (NED) 1 arc-second"]
 
-        while True:
-            params = {
-                "bbox": bbox_str,
-                "max": 100,
-                "offset": offset,
-                "datasets": ",".join(dataset_names),
-            }
-
-            if self.q:
-                params["q"] = str(self.q)
-            if self.formats:
-                params["prodFormats"] = self.formats.replace("/", ",")
-            if self.extents:
-                params["prodExtents"] = self.extents.replace("/", ",")
-
-            if self.date_start:
-                params["start"] = self.date_start
-                params["end"] = (
-                    self.date_end if self.date_end else utils.this_date()[:8]
-                )  # YYYYMMDD
-                params["dateType"] = self.date_type
-
-            req = core.Fetch(TNM_API_PRODUCTS_URL).fetch_req(
-                params=params, timeout=60, read_timeout=60
+        base_params = self._base_params(bbox_str, dataset_names)
+
+        # Preflight with a single-item page to learn the total; empty regions
+        # stop here, and every full page can then be fetched concurrently.
+        total, entries = self._fetch_page({**base_params, "max": 1}, 0)
+        if not total:
+            return
+
+        if total == 1:
+            for entry in entries:
+                yield self.make_entry(**entry)
+            return
+
+        fetch_page = functools.partial(self._fetch_page, base_params)
+        offsets = iter(range(0, total, PAGE_SIZE))
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Keep at most MAX_WORKERS pages in flight (yielded in order), so
+            # parsed pages never pile up ahead of the consumer.
+            pending = collections.deque(
+                (offset, executor.submit(fetch_page, offset))
+                for offset in itertools.islice(offsets, MAX_WORKERS)
+            )
+            failed = []
+            while pending:
+                page_offset, future = pending.popleft()
+                offset = next(offsets, None)
+                if offset is not None:
+                    pending.append((offset, executor.submit(fetch_page, offset)))
+
+                page_total, entries = future.result()
+                if page_total is None:
+                    failed.append(page_offset)
+                for entry in entries:
+                    yield self.make_entry(**entry)
+
+        if failed:
+            logger.warning(
+                f"TNM results are incomplete: {len(failed)} of "
+                f"{-(-total // PAGE_SIZE)} pages failed (offsets {failed})."
             )
-
-            if req is None or req.status_code != 200:
-                logger.error(
-                    f"TNM API Failed: {req.status_code if req else 'No Response'}"
-                )
-                break
-
-            if req.text.strip().startswith("{errorMessage"):
-                logger.error(f"TNM API Error: {req.text}")
-                break
-
-            try:
-                data = req.json()
-                total = data.get("total", 0)
-                items = data.get("items", [])
-
-                for item in items:
-                    url = item.get("downloadURL")
-                    if not url:
-                        continue
-
-                    filename = url.split("/")[-1]
-                    fmt = item.get("format", "Unknown")
-
-                    item_bbox = item.get("boundingBox", {})
-                    bounds = None
-                    if item_bbox:
-                        bounds = (
-                            item_bbox.get("minX"),
-                            item_bbox.get("maxX"),
-                            item_bbox.get("minY"),
-                            item_bbox.get("maxY"),
-                        )
-
-                    self.add_entry_to_results(
-                        url=url,
-                        dst_fn=filename,
-                        data_type="tnm",
-                        format=fmt,
-                        bounds=bounds,
-                        date=item.get("publicationDate"),
-                        remote_size=item.get("sizeInBytes"),
-                        title=item.get("title"),
-                    )
-
-            except Exception as e:
-                logger.error(f"Error parsing TNM JSON: {e}")
-                break
-
-            offset += 100
-            if offset >= total:
-                break
-
-        return self
 
 
 # =============================================================================
@@ -234,20 +370,7 @@ class NED(TheNationalMap):
     """
 
     def __init__(self, res: str = "13", **kwargs):
-        # Map resolution strings to TNM Dataset Indices
-        # 1 = NED 1 arc-sec
-        # 2 = DEM 1 meter
-        # 3 = NED 1/3 arc-sec
-
-        mapping = {
-            "13": "1/3",  # Standard seamless (Old Default)
-            "1m": "2",  # High res
-            "1": "1",  # Coarse
-            "1/3": "3",  # Standard
-            "all": "1/2/3",  # Everything
-        }
-
-        selected_datasets = mapping.get(res, "1/3")
+        selected_datasets = NED_RES_DATASETS.get(res, "1/3")
 
         super().__init__(datasets=selected_datasets, **kwargs)
 
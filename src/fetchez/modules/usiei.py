@@ -14,6 +14,7 @@ Query the US Interagency Elevation Inventory (USIEI) via ArcGIS REST API.
 from urllib.parse import urlencode
 from fetchez import core
 from fetchez import cli
+from fetchez import spatial
 
 USIEI_MAP_SERVER_URL = (
     "https://coast.noaa.gov/arcgis/rest/services/"
@@ -78,7 +79,7 @@ class USIEI(core.FetchModule):
         query_url = f"{USIEI_MAP_SERVER_URL}/{self.layer}/query"
         full_url = f"{query_url}?{urlencode(params)}"
 
-        r_str = f"w{w}_e{e}_s{s}_n{n}".replace(".", "p").replace("-", "m")
+        r_str = spatial.region_to_slug((w, e, s, n))
 
         layer_names = {0: "topobathy", 1: "bathy", 2: "topo", 3: "ifsar", 4: "other"}
         l_name = layer_names.get(self.layer, f"layer{self.layer}")
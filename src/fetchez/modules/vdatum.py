@@ -12,9 +12,13 @@ Fetch NOAA Tidal Grids (MLLW, MHHW) from vdatum.noaa.gov.
 """
 
 import os
+import re
+import json
 import logging
+import zipfile
 from typing import Optional
 from fetchez import core
+from fetchez import utils
 from fetchez import cli
 from fetchez import fred
 
@@ -32,6 +36,10 @@ VDATUM_REGIONS = [
     "VERTCON",
 ]
 
+# Matches the bounds lines of an INF file, e.g. "grid.minlon = -124.5"
+_INF_RX = re.compile(rb"(?mi)^\s*(?:\S+\.)?(minlon|maxlon|minlat|maxlat)\s*=\s*(\S+)")
+_INF_KEYS = {b"minlon": "w", b"maxlon": "e", b"minlat": "s", b"maxlat": "n"}
+
 
 @cli.cli_opts(
     help_text="NOAA VDatum Tidal Grids",
@@ -55,6 +63,43 @@ class VDatum(core.FetchModule):
         self.force_update = update
 
         self.fred = fred.FRED("vdatum", local=False)
+        self.validators_path = f"{os.path.splitext(self.fred.path)[0]}_etags.json"
+
+    def _load_validators(self):
+        """Load the cached ETag/Last-Modified of each indexed ZIP."""
+
+        try:
+            with open(self.validators_path, "rb") as f:
+                return utils.json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_validators(self, validators):
+        try:
+            with open(self.validators_path, "w", encoding="utf-8") as f:
+                json.dump(validators, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not save {self.validators_path}: {e}")
+
+    def _remote_validators(self, url):
+        """HEAD `url` and return its ETag and Last-Modified headers."""
+
+        try:
+            resp = core.get_session().head(url, allow_redirects=True, timeout=20)
+        except Exception:
+            return {}
+
+        if resp.status_code != 200:
+            return {}
+
+        return {
+            k: v
+            for k, v in (
+                ("etag", resp.headers.get("ETag")),
+                ("last_modified", resp.headers.get("Last-Modified")),
+            )
+            if v
+        }
 
     def _scrape_and_index(self):
         """Download zips, parse .inf, update index."""
@@ -65,6 +110,9 @@ class VDatum(core.FetchModule):
         if not os.path.exists(temp_dir):
             os.makedirs(temp_dir)
 
+        validators = self._load_validators()
+        indexed = {f.get("properties", {}).get("DataLink") for f in self.fred.features}
+
         for region in VDATUM_REGIONS:
             fname = f"{region}.zip"
             if region == "TIDAL":
@@ -75,32 +123,38 @@ class VDatum(core.FetchModule):
             url = f"{VDATUM_DATA_URL}{fname}"
             local_zip = os.path.join(temp_dir, fname)
 
+            # Skip ZIPs that haven't changed since they were last indexed
+            remote = self._remote_validators(url)
+            if remote and remote == validators.get(url) and url in indexed:
+                logger.info(f"{region} is unchanged, keeping its index entries.")
+                continue
+
             logger.info(f"Indexing {region}...")
-            if core.Fetch(url).fetch_file(local_zip) != 0:
+            z = self._open_zip(url, local_zip)
+            if z is None:
                 continue
 
-            try:
-                import zipfile
+            # Replace (rather than duplicate) any stale entries for this ZIP
+            self.fred.features = [
+                f
+                for f in self.fred.features
+                if f.get("properties", {}).get("DataLink") != url
+            ]
 
-                with zipfile.ZipFile(local_zip, "r") as z:
+            try:
+                with z:
                     for zf in z.namelist():
                         if zf.endswith(".inf"):
                             with z.open(zf) as inf:
-                                content = inf.read().decode("utf-8", errors="ignore")
-                                meta = self._parse_inf(content)
+                                meta = self._parse_inf(inf.read())
 
                                 if meta:
+                                    w, e, s, n = (meta[k] for k in "wesn")
                                     geom = {
                                         "type": "Polygon",
-                                        "coordinates": [
-                                            [
-                                                [meta["w"], meta["s"]],
-                                                [meta["e"], meta["s"]],
-                                                [meta["e"], meta["n"]],
-                                                [meta["w"], meta["n"]],
-                                                [meta["w"], meta["s"]],
-                                            ]
-                                        ],
+                                        "coordinates": (
+                                            ((w, s), (e, s), (e, n), (w, n), (w, s)),
+                                        ),
                                     }
 
                                     self.fred.add_survey(
@@ -114,6 +168,8 @@ class VDatum(core.FetchModule):
                                         else "geoid",
                                         DataSource="vdatum",
                                     )
+                if remote:
+                    validators[url] = remote
             except Exception as e:
                 logger.warning(f"Failed to parse {fname}: {e}")
 
@@ -121,27 +177,45 @@ class VDatum(core.FetchModule):
                 os.remove(local_zip)
 
         self.fred.save()
+        self._save_validators(validators)
         logger.info("VDatum Indexing Complete.")
 
-    def _parse_inf(self, text):
-        """Helper to extract bounds from VDatum INF format."""
+    def _open_zip(self, url, local_zip):
+        """Open a regional ZIP, reading it remotely if the server allows.
 
-        d = {}
-        for line in text.splitlines():
-            if "=" in line:
-                k, v = line.split("=", 1)
-                d[k.strip().lower().split(".")[-1]] = v.strip()
+        Over HTTP range requests only the central directory and the .inf
+        members are transferred, not the grids. If that fails, the whole
+        ZIP is downloaded to `local_zip` as before.
+        """
 
         try:
-            return {
-                "w": float(d.get("minlon", 0)),
-                "e": float(d.get("maxlon", 0)),
-                "s": float(d.get("minlat", 0)),
-                "n": float(d.get("maxlat", 0)),
-            }
-        except Exception:
+            remote = core.HttpFile(url, session=core.get_session())
+            if remote.size:
+                return zipfile.ZipFile(remote, "r")
+        except Exception as e:
+            logger.debug(f"Remote read of {url} failed, downloading instead: {e}")
+
+        if core.Fetch(url).fetch_file(local_zip) != 0:
+            return None
+
+        try:
+            return zipfile.ZipFile(local_zip, "r")
+        except zipfile.BadZipFile as e:
+            logger.warning(f"Failed to open {os.path.basename(local_zip)}: {e}")
             return None
 
+    def _parse_inf(self, content):
+        """Helper to extract bounds from VDatum INF format (raw bytes)."""
+
+        d = {"w": 0.0, "e": 0.0, "s": 0.0, "n": 0.0}
+        try:
+            for m in _INF_RX.finditer(content):
+                d[_INF_KEYS[m.group(1).lower()]] = float(m.group(2))
+        except ValueError:
+            return None
+
+        return d
+
     def run(self):
         if self.force_update or not self.fred.features:
             self._scrape_and_index()
@@ -150,12 +224,11 @@ class VDatum(core.FetchModule):
             logger.error("VDatum index is empty. Scrape failed.")
             return self
 
-        results = self.fred.search(region=self.region)
+        results = self.fred.iter_search(region=self.region)
+        if self.datatype:
+            results = (r for r in results if self.datatype in r.get("DataType", ""))
 
         for r in results:
-            if self.datatype and self.datatype not in r.get("DataType", ""):
-                continue
-
             self.add_entry_to_results(
                 url=r["DataLink"],
                 dst_fn=os.path.basename(r["DataLink"]),
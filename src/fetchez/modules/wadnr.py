@@ -11,25 +11,38 @@ Fetch LiDAR data from the Washington State Department of Natural Resources (WA D
 :license: MIT, see LICENSE for more details.
 """
 
-import json
+import re
 import math
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from urllib.parse import urlencode
 from fetchez import core
+from fetchez import utils
 from fetchez import cli
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
 WA_DNR_BASE = "https://lidarportal.dnr.wa.gov"
 WA_DNR_DOWNLOAD_URL = f"{WA_DNR_BASE}/download"
 WA_DNR_REST_URL = f"{WA_DNR_BASE}/arcgis/rest/services/lidar/wadnr_hillshade/MapServer"
 WA_DNR_LAYERS_URL = f"{WA_DNR_REST_URL}/layers?f=pjson"
+MAX_WORKERS = 16
 
 
+@functools.lru_cache(maxsize=2048)
 def mercator_to_latlon(x, y):
     """Convert Web Mercator (EPSG:3857) to WGS84 (EPSG:4326).
     Simple math implementation to avoid heavy dependencies like pyproj.
+    Memoized, as neighbouring layers on the tile grid share corners.
     """
 
     lon = (x / 20037508.34) * 180
@@ -38,6 +51,63 @@ def mercator_to_latlon(x, y):
     return (lon, lat)
 
 
+def _resolve_download(name_url):
+    """Resolve the final download url for a (name, download request url) pair."""
+
+    name, dl_req_url = name_url
+    try:
+        r = core.Fetch(dl_req_url).fetch_req()
+        if r and r.status_code == 200:
+            try:
+                return utils.json_loads(r.content).get("url")
+            except Exception:
+                return r.url  # If it was a redirect
+    except Exception as e:
+        logger.warning(f"Failed to resolve download for {name}: {e}")
+
+    return None
+
+
+def _extent_values(layer):
+    """Return the (xmin, ymin, xmax, ymax) of a layer extent, NaN if missing."""
+
+    extent = layer.get("extent") or {}
+    try:
+        return tuple(float(extent[k]) for k in ("xmin", "ymin", "xmax", "ymax"))
+    except (KeyError, TypeError, ValueError):
+        return (math.nan,) * 4
+
+
+def intersecting_layers(layers, region):
+    """Return the indices of `layers` whose Web Mercator extent intersects `region`.
+
+    All extents are converted to WGS84 and tested against the region in one
+    vectorized NumPy pass. Layers without a valid extent never match.
+    """
+
+    if not layers:
+        return []
+
+    ext = np.array([_extent_values(layer) for layer in layers], dtype=np.float64)
+    lon = ext[:, [0, 2]] / 20037508.34 * 180
+    lat = np.degrees(
+        2 * np.arctan(np.exp(np.radians(ext[:, [1, 3]] / 20037508.34 * 180)))
+        - np.pi / 2
+    )
+
+    r_w, r_e, r_s, r_n = region
+    with np.errstate(invalid="ignore"):
+        keep = ~(
+            (r_w > lon[:, 1])
+            | (r_e < lon[:, 0])
+            | (r_s > lat[:, 1])
+            | (r_n < lat[:, 0])
+        )
+
+    keep &= np.isfinite(ext).all(axis=1)
+    return np.nonzero(keep)[0].tolist()
+
+
 # =============================================================================
 # WADNR Module
 # =============================================================================
@@ -45,6 +115,7 @@ def mercator_to_latlon(x, y):
     help_text="Washington State DNR LiDAR",
     filter="Filter projects by name (case-insensitive substring).",
     project_id="Filter by specific Project ID (integer).",
+    update="Force a refresh of the cached layer metadata.",
 )
 class WADNR(core.FetchModule):
     """Fetch LiDAR data from the Washington State DNR Portal.
@@ -58,29 +129,16 @@ class WADNR(core.FetchModule):
     """
 
     def __init__(
-        self, filter: Optional[str] = None, project_id: Optional[str] = None, **kwargs
+        self,
+        filter: Optional[str] = None,
+        project_id: Optional[str] = None,
+        update: bool = False,
+        **kwargs,
     ):
         super().__init__(name="wadnr", **kwargs)
-        self.name_filter = filter.lower() if filter else None
+        self.name_rx = re.compile(re.escape(filter), re.IGNORECASE) if filter else None
         self.project_id = int(project_id) if project_id else None
-
-    def _intersects_mercator(self, extent_3857):
-        """Check intersection after converting extent to WGS84."""
-
-        if not extent_3857 or not self.region:
-            return False
-
-        try:
-            w_geo, s_geo = mercator_to_latlon(extent_3857["xmin"], extent_3857["ymin"])
-            e_geo, n_geo = mercator_to_latlon(extent_3857["xmax"], extent_3857["ymax"])
-
-            r_w, r_e, r_s, r_n = self.region
-
-            if (r_w > e_geo) or (r_e < w_geo) or (r_s > n_geo) or (r_n < s_geo):
-                return False
-            return True
-        except Exception:
-            return False
+        self.force_update = update
 
     def run(self):
         """Run the WA DNR fetching logic."""
@@ -89,32 +147,39 @@ class WADNR(core.FetchModule):
             return []
 
         logger.info("Querying WA DNR Layer Metadata...")
-        req = core.Fetch(WA_DNR_LAYERS_URL).fetch_req()
+        data = core.CachedFetch(WA_DNR_LAYERS_URL).fetch_json(force=self.force_update)
 
-        if not req or req.status_code != 200:
+        if not isinstance(data, dict):
             logger.error("Failed to fetch WA DNR layers.")
             return self
 
-        try:
-            data = req.json()
-        except json.JSONDecodeError:
-            logger.error("Invalid JSON response from WA DNR.")
-            return self
-
         layers = data.get("layers", [])
         logger.info(f"Scanning {len(layers)} projects...")
 
-        matches = 0
-        for layer in layers:
+        if self.name_rx is not None:
+            layers = [
+                layer
+                for layer in layers
+                if self.name_rx.search(layer.get("name", "Unknown"))
+            ]
+
+        if HAS_NUMPY:
+            candidates = [layers[i] for i in intersecting_layers(layers, self.region)]
+        else:
+            # Layers without a valid extent are NaN and never compare true.
+            r_w, r_e, r_s, r_n = self.region
+            candidates = []
+            for layer in layers:
+                xmin, ymin, xmax, ymax = _extent_values(layer)
+                w_geo, s_geo = mercator_to_latlon(xmin, ymin)
+                e_geo, n_geo = mercator_to_latlon(xmax, ymax)
+                if r_w <= e_geo and r_e >= w_geo and r_s <= n_geo and r_n >= s_geo:
+                    candidates.append(layer)
+
+        pending = []
+        for layer in candidates:
             name = layer.get("name", "Unknown")
 
-            if self.name_filter and self.name_filter not in name.lower():
-                continue
-
-            extent = layer.get("extent")
-            if not self._intersects_extent(extent):
-                continue
-
             valid_id = None
 
             if self.project_id:
@@ -144,36 +209,29 @@ class WADNR(core.FetchModule):
             params = {
                 "ids": valid_id,  # Can be list, here we do one by one
                 "format": "json",
-                "geojson": json.dumps(geojson_poly),
+                "geojson": utils.json_dumps(geojson_poly),
             }
 
             dl_req_url = f"{WA_DNR_DOWNLOAD_URL}?{urlencode(params)}"
+            pending.append((valid_id, name, dl_req_url))
 
-            try:
-                r = core.Fetch(dl_req_url).fetch_req()
-                if r and r.status_code == 200:
-                    try:
-                        resp_json = r.json()
-                        final_url = resp_json.get("url")
-                    except Exception:
-                        final_url = r.url  # If it was a redirect
-
-                    if final_url:
-                        self.add_entry_to_results(
-                            url=final_url,
-                            dst_fn=f"wa_dnr_{valid_id}_{name.replace(' ', '_')}.zip",
-                            data_type="lidar",
-                            agency="WA DNR",
-                            title=name,
-                        )
-                        matches += 1
-            except Exception as e:
-                logger.warning(f"Failed to resolve download for {name}: {e}")
+        # Resolve the final download urls concurrently, then add the results
+        # back in scan order.
+        matches = 0
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            resolved = executor.map(
+                _resolve_download, [(name, url) for _, name, url in pending]
+            )
+            for (valid_id, name, _), final_url in zip(pending, resolved):
+                if final_url:
+                    self.add_entry_to_results(
+                        url=final_url,
+                        dst_fn=f"wa_dnr_{valid_id}_{name.replace(' ', '_')}.zip",
+                        data_type="lidar",
+                        agency="WA DNR",
+                        title=name,
+                    )
+                    matches += 1
 
         logger.info(f"Found {matches} WA DNR projects.")
         return self
-
-    def _intersects_extent(self, extent_3857):
-        """Wrapper for readability."""
-
-        return self._intersects_mercator(extent_3857)
@@ -19,13 +19,36 @@ from urllib.parse import urlencode
 from typing import Optional
 
 from fetchez import core
+from fetchez import utils
 from fetchez import cli
 
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 logger = logging.getLogger(__name__)
 
 WATER_SERVICES_IV_URL = "https://waterservices.usgs.gov/nwis/iv/?"
 
 
+def _iter_time_series(req):
+    """Yield the `value.timeSeries` items of a streamed response.
+
+    Uses ijson (if available) so only one time series is held in memory,
+    otherwise falls back to parsing the whole response at once.
+    """
+
+    if HAS_IJSON:
+        req.raw.decode_content = True
+        yield from ijson.items(req.raw, "value.timeSeries.item", use_float=True)
+    else:
+        data = utils.json_loads(req.content)
+        yield from data.get("value", {}).get("timeSeries", [])
+
+
 # =============================================================================
 # WaterServices Module
 # =============================================================================
@@ -114,17 +137,15 @@ class WaterServices(core.FetchModule):
                 logger.error("Failed to retrieve station info.")
                 return
 
-            data = req.json()
-            time_series = data.get("value", {}).get("timeSeries", [])
+            header = False
+            for item in _iter_time_series(req):
+                if not header:
+                    print(
+                        f"\n{'STATION NAME':<30} | {'PARAM':<20} | {'VALUE':<10} | {'TIME'}"
+                    )
+                    print("-" * 80)
+                    header = True
 
-            if not time_series:
-                logger.info("No stations found matching criteria.")
-                return
-
-            print(f"\n{'STATION NAME':<30} | {'PARAM':<20} | {'VALUE':<10} | {'TIME'}")
-            print("-" * 80)
-
-            for item in time_series:
                 try:
                     source = item.get("sourceInfo", {})
                     site_name = source.get("siteName", "Unknown")[
@@ -145,10 +166,18 @@ class WaterServices(core.FetchModule):
                         val = "N/A"
                         ts = "--:--"
 
-                    print(f"{site_name:<30} | {var_name:<20} | {val:<10} | {ts}")
+                    print(
+                        f"{site_name:<30} | {var_name:<20} | {val:<10} | {ts}",
+                        flush=True,
+                    )
 
                 except (KeyError, IndexError):
                     continue
+
+            if not header:
+                logger.info("No stations found matching criteria.")
+                return
+
             print("-" * 80 + "\n")
 
         except Exception as e:
@@ -65,7 +65,7 @@ class WikiGeo(core.FetchModule):
 
             full_url = f"{WIKI_API}?{urlencode(params)}"
 
-            r_str = f"w{w:.3f}_n{n:.3f}".replace(".", "p").replace("-", "m")
+            r_str = f"w{w:.3f}_n{n:.3f}".translate(spatial.REGION_SLUG_TABLE)
             out_fn = f"wiki_context_{r_str}.json"
 
             self.add_entry_to_results(
@@ -12,8 +12,8 @@ Preset 'hook' macros.
 """
 
 import os
-import copy
 import logging
+from collections import ChainMap
 
 from . import config
 from . import utils
@@ -112,35 +112,28 @@ def register_module_preset(module, name, help_text, hooks):
 def get_module_presets(module_name):
     """Return presets registered for a specific module,
     PLUS any global presets that don't conflict.
-    """
-
-    # Start with global
-    available = _GLOBAL_PRESETS.copy()
 
-    # Overlay module specific ones (they take precedence)
-    if module_name in _MODULE_PRESETS:
-        mod_specific = _MODULE_PRESETS[module_name]
-        available.update(mod_specific)
+    The result is a view over the registries (module specific presets take
+    precedence); writes go to a fresh front map, never to the registries.
+    """
 
-    return available
+    return ChainMap({}, _MODULE_PRESETS.get(module_name, {}), _GLOBAL_PRESETS)
 
 
 def get_global_presets():
-    """Return combined user presets AND plugin presets."""
+    """Return combined user presets AND plugin presets.
 
-    all_presets = _GLOBAL_PRESETS.copy()
-    user_presets = load_user_presets()
-    all_presets.update(user_presets)
+    The result is a view (user presets take precedence); writes go to a
+    fresh front map, never to the loaded presets.
+    """
 
-    return all_presets
+    return ChainMap({}, load_user_presets(), _GLOBAL_PRESETS)
 
 
 # maybe we have it init actual presets?
 def init_current_presets():
     """Export the CURRENT active presets (built-ins + loaded plugins) to a JSON file."""
 
-    import yaml
-
     output_filename = "fetchez_presets_template.yaml"
     output_path = os.path.abspath(output_filename)
 
@@ -149,14 +142,15 @@ def init_current_presets():
         logger.warning("Please remove or rename it to generate a fresh template.")
         return
 
-    export_data = {"presets": copy.deepcopy(_GLOBAL_PRESETS), "modules": {}}
+    # yaml_dump only reads the registries, so no need to copy them first
+    export_data = {"presets": _GLOBAL_PRESETS, "modules": {}}
 
     for mod_name, presets_dict in _MODULE_PRESETS.items():
-        export_data["modules"][mod_name] = {"presets": copy.deepcopy(presets_dict)}
+        export_data["modules"][mod_name] = {"presets": presets_dict}
 
     try:
         with open(output_path, "w") as f:
-            yaml.dump(export_data, f, sort_keys=False, default_flow_style=False)
+            config.yaml_dump(export_data, f, sort_keys=False, default_flow_style=False)
 
         print(f"{utils.GREEN}✅ Exported active presets to: {utils.RESET}{output_path}")
         print("\nTo use these as your personal defaults:")
@@ -171,8 +165,6 @@ def init_current_presets():
 def init_presets():
     """Generate a default presets.json file."""
 
-    import yaml
-
     config_dir = config.CONFIG_PATH
     config_file = os.path.join(config_dir, "presets.yaml")
 
@@ -219,7 +211,9 @@ def init_presets():
         with open(config_file, "w") as f:
             f.write("# Fetchez User Configuration & Presets\n")
             f.write("# Define your custom workflow macros here.\n\n")
-            yaml.dump(default_config, f, sort_keys=False, default_flow_style=False)
+            config.yaml_dump(
+                default_config, f, sort_keys=False, default_flow_style=False
+            )
 
         logger.info(f"Created default configuration at: {config_file}")
         logger.info("Edit this file to add your own workflow presets.")
@@ -11,13 +11,24 @@ This module contains the Module Registry for the Fetchez library.
 :license: MIT, see LICENSE for more details.
 """
 
+import sys
 import logging
+import threading
 import importlib.metadata
-import copy
 from typing import Dict, Any, cast
 
 logger = logging.getLogger(__name__)
 
+# Where the per-directory records of the FetchModules each user plugin
+# file defines are kept, relative to the user's home directory
+PLUGIN_MANIFEST_DIR = (".fetchez", "cache", "plugins")
+
+# Guards plugin execution and the temporary sys.path entry it needs
+_PLUGIN_LOCK = threading.RLock()
+
+# Serializes writes to the module table; lookups stay lock-free
+_REGISTRY_LOCK = threading.Lock()
+
 
 # =============================================================================
 # Fetchez Registry
@@ -39,6 +50,34 @@ logger = logging.getLogger(__name__)
 class FetchezRegistry:
     """Fetchez Module Registry with expanded metadata for discovery."""
 
+    # Each plugin loader only needs to scan once per process
+    _user_loaded = False
+    _installed_loaded = False
+
+    # Set by _ensure_plugins only once both loaders have finished
+    _plugins_ready = False
+
+    # Standard module classes already resolved through importlib
+    _class_cache = {}
+
+    # Resolved (inherited) metadata per key and alias -> key lookups; both
+    # are rebuilt whenever a module is registered.
+    _info_cache = {}
+    _alias_index = None
+
+    # Lowercased, tab-joined searchable text per module key
+    _search_index = None
+
+    # Per metadata field (tags, category, ...): lowercased value -> module keys
+    _field_indexes = {}
+
+    # Executed user plugin files, keyed on their path
+    _plugin_modules = {}
+
+    # Built-in entries replaced by a plugin of the same name, restored
+    # by unregister_module
+    _shadowed = {}
+
     _modules = {
         # Generic https module to send an argument to FetchModule.results
         "https": {"mod": "fetchez.core", "cls": "HttpDataset", "category": "Generic"},
@@ -1019,133 +1058,353 @@ class FetchezRegistry:
     }
 
     @classmethod
-    def get_info(cls, mod_key: str) -> dict:
-        """Retrieve the full metadata dictionary for a module,
-        resolving metadta inheritance.
+    def _clear_caches(cls):
+        """Drop the derived lookups after the module table changes."""
+
+        cls._info_cache.clear()
+        cls._alias_index = None
+        cls._search_index = None
+        cls._field_indexes = {}
+
+    @staticmethod
+    def _is_dynamic(entry):
+        """True for entries added at runtime (register_module or user plugins)."""
+
+        return "_class_obj" in entry or "_plugin_path" in entry
+
+    @classmethod
+    def _set_module(cls, mod_key, entry):
+        """Add (or replace) a registry entry and invalidate what derives from it."""
+
+        with _REGISTRY_LOCK:
+            current = cls._modules.get(mod_key)
+            if current is not None and not cls._is_dynamic(current):
+                cls._shadowed.setdefault(mod_key, current)
+            cls._modules[mod_key] = entry
+            cls._class_cache.pop(mod_key, None)
+            cls._clear_caches()
+
+    @classmethod
+    def resolve_key(cls, mod_key: str):
+        """Return the registry key for `mod_key` or one of its aliases.
+
+        Returns None if `mod_key` is neither a module nor an alias.
         """
 
-        if mod_key not in cls._modules:
+        if mod_key in cls._modules:
+            return mod_key
+
+        if cls._alias_index is None:
+            alias_index = {}
             for k, v in cast(Dict[Any, Any], cls._modules.items()):
-                if mod_key in v.get("aliases", []):
-                    mod_key = k
-                    break
+                for alias in v.get("aliases", []):
+                    alias_index.setdefault(alias, k)
+            cls._alias_index = alias_index
 
-        if mod_key not in cls._modules:
-            return {}
+        return cls._alias_index.get(mod_key)
+
+    @classmethod
+    def _resolve_all(cls):
+        """Flatten the metadata inheritance of every module in one pass."""
+
+        resolved: Dict[Any, Any] = {}
+
+        def resolve(key):
+            if key in resolved:
+                return resolved[key]
+
+            entry: Dict[Any, Any] = cast(Dict[Any, Any], cls._modules[key])
+            if "inherits" in entry:
+                parent_key = cls.resolve_key(entry["inherits"])
+                parent = resolve(parent_key) if parent_key is not None else {}
+
+                # A shallow copy is enough: `tags` and `urls` are rebuilt below
+                # rather than updated in place, so the parent is never modified.
+                merged = dict(parent)
+
+                for k, v in entry.items():
+                    if k == "tags" and "tags" in merged:
+                        # Ordered de-duplication, parent tags first
+                        merged["tags"] = list(dict.fromkeys(merged["tags"] + v))
+                    elif k == "urls" and "urls" in merged:
+                        merged["urls"] = {**merged["urls"], **v}
+                    else:
+                        merged[k] = v
+
+                entry = merged
 
-        entry: Dict[Any, Any] = cast(Dict[Any, Any], cls._modules[mod_key])
+            resolved[key] = entry
+            return entry
 
-        if "inherits" in entry:
-            parent_key = entry["inherits"]
-            parent = cls.get_info(parent_key)
+        for key in cls._modules:
+            resolve(key)
 
-            merged = copy.deepcopy(parent)
+        cls._info_cache = resolved
 
-            for k, v in entry.items():
-                if k == "tags" and "tags" in merged:
-                    merged["tags"] = list(set(merged["tags"] + v))
-                elif k == "urls" and "urls" in merged:
-                    merged["urls"].update(v)
-                else:
-                    merged[k] = v
+    @classmethod
+    def get_info(cls, mod_key: str) -> dict:
+        """Retrieve the full metadata dictionary for a module,
+        resolving metadta inheritance.
 
-            return merged
+        All modules are resolved together on first use (and again after a
+        new module is registered); treat the returned dictionary as read-only.
+        """
 
-        return entry
+        key = cls.resolve_key(mod_key)
+        if key is None:
+            return {}
+
+        info = cls._info_cache.get(key)
+        if info is None:
+            cls._resolve_all()
+            info = cls._info_cache[key]
+        return info
+
+    @classmethod
+    def _ensure_plugins(cls):
+        """Load the user and installed plugins, once, before they are needed."""
+
+        if cls._plugins_ready:
+            return
+
+        # The loaders flag themselves as loaded on entry, so wait on the lock
+        # (not those flags) until the registry is fully populated.
+        with _PLUGIN_LOCK:
+            if cls._plugins_ready:
+                return
+            cls.load_user_plugins()
+            cls.load_installed_plugins()
+            cls._plugins_ready = True
 
     @classmethod
     def load_module(cls, mod_key):
         """Import and return the (module or user-plugin) class using `importlib`."""
 
-        meta = cls._modules[mod_key]
+        cls._ensure_plugins()
+
+        # Aliases share their module's cache entry
+        key = cls.resolve_key(mod_key)
+        if key is None:
+            return None
+
+        meta = cls._modules[key]
 
         # User Plugin
         if "_class_obj" in meta:
             return meta["_class_obj"]
 
-        # Standard Module
-        if mod_key not in cls._modules:
-            return None
+        # User Plugin registered from the manifest, not executed yet
+        if "_plugin_path" in meta:
+            filepath = meta["_plugin_path"]
+            try:
+                # Execute each plugin file once, even if asked from two threads
+                with _PLUGIN_LOCK:
+                    user_mod = cls._plugin_modules.get(filepath)
+                    if user_mod is None:
+                        user_mod = cls._exec_plugin(meta["mod"], filepath)
+                        cls._plugin_modules[filepath] = user_mod
+                meta["_class_obj"] = getattr(user_mod, meta["cls"])
+            except Exception as e:
+                logger.error(f"Failed to load {mod_key}: {e}")
+                return None
+            return meta["_class_obj"]
 
-        info = cls.get_info(mod_key)
-        if not info:
-            return None
+        # Standard Module; only imported on first use, discovery
+        # (get_info, search_modules) never imports anything.
+        mod_cls = cls._class_cache.get(key)
+        if mod_cls is not None:
+            return mod_cls
+
+        # Only inheriting entries need resolving (`mod`/`cls` may come from
+        # the parent); everything else already has what we need in `meta`.
+        info = cls.get_info(key) if "inherits" in meta else meta
 
         try:
-            module = importlib.import_module(info["mod"])
+            # Skip the import machinery (and its lock) for loaded modules
+            module = sys.modules.get(info["mod"]) or importlib.import_module(
+                info["mod"]
+            )
             mod_cls = getattr(module, info["cls"])
+            cls._class_cache[key] = mod_cls
             return mod_cls
         except (ImportError, AttributeError) as e:
             logger.error(f"Failed to load {mod_key}: {e}")
             return None
 
+    @staticmethod
+    def _exec_plugin(module_name, filepath):
+        """Execute a user plugin file and return the resulting python module."""
+
+        import os
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(module_name, filepath)
+        if not (spec and spec.loader):
+            return None
+
+        # Plugins may now be executed lazily from load_module, i.e. from any
+        # thread, so serialize the sys.path edits (and the exec itself).
+        plugin_dir = os.path.dirname(os.path.abspath(filepath))
+        with _PLUGIN_LOCK:
+            # Add the plugin_dir to the system path for sibling imports, unless
+            # it is already importable
+            added = plugin_dir not in sys.path
+            if added:
+                sys.path.insert(0, plugin_dir)
+            try:
+                user_mod = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(user_mod)
+            finally:
+                if added:
+                    sys.path.remove(plugin_dir)
+
+        return user_mod
+
+    @classmethod
+    def _scan_plugin(cls, module_name, filepath):
+        """Execute a plugin file and describe the FetchModules it defines.
+
+        Returns a list of (manifest record, class) tuples.
+        """
+
+        from .core import FetchModule
+
+        user_mod = cls._exec_plugin(module_name, filepath)
+        if user_mod is None:
+            return []
+
+        cls._plugin_modules[filepath] = user_mod
+        found = []
+        # The module namespace directly; inspect.getmembers would dir(), sort
+        # and getattr() every attribute.
+        for name, obj in list(vars(user_mod).items()):
+            if isinstance(obj, type) and issubclass(obj, FetchModule):
+                if obj is FetchModule:
+                    continue
+
+                # Check for @cli_opts metadata; or defaults
+                record = {
+                    "key": getattr(obj, "name", name.lower()),
+                    "cls": name,
+                    # Own docstring only; inspect.getdoc would fall back to
+                    # FetchModule's. partition stops at the first line.
+                    "desc": (obj.__doc__ or "User defined module")
+                    .strip()
+                    .partition("\n")[0],
+                }
+                found.append((record, obj))
+
+        return found
+
+    @staticmethod
+    def plugin_manifest_path(plugin_dir):
+        """Return the manifest file for `plugin_dir`, keyed on its absolute path."""
+
+        import os
+        import hashlib
+
+        key = hashlib.sha1(os.path.abspath(plugin_dir).encode("utf-8")).hexdigest()
+        return os.path.join(
+            os.path.expanduser("~"), *PLUGIN_MANIFEST_DIR, f"{key[:16]}.json"
+        )
+
     @classmethod
     def load_user_plugins(cls):
-        """Scan ~/.fetchez/plugins/ and .fetchez/plugins for external modules and register them."""
+        """Scan ~/.fetchez/plugins/ and .fetchez/plugins for external modules and register them.
+
+        What each plugin file defines is remembered in a manifest under
+        ~/.fetchez/cache/plugins (one per plugin directory). Files that have
+        not changed since are registered from the manifest and only executed
+        when `load_module` needs them.
+        """
+
+        if cls._user_loaded:
+            return
+        cls._user_loaded = True
 
         import os
-        import sys
-        import inspect
-        import importlib.util
-        from . import core
+        from . import utils
 
         home_dir = os.path.expanduser("~")
         home_plugin_dir = os.path.join(home_dir, ".fetchez", "plugins")
         cwd_plugin_dir = os.path.join(".fetchez", "plugins")
 
         for plugin_dir in [home_plugin_dir, cwd_plugin_dir]:
-            if not os.path.exists(plugin_dir):
-                return
+            # One directory read; DirEntry caches the file type for us
+            try:
+                with os.scandir(plugin_dir) as it:
+                    plugin_files = sorted(
+                        (e for e in it if e.name.endswith(".py") and e.is_file()),
+                        key=lambda e: e.name,
+                    )
+            except OSError:
+                continue
 
-            # Add the plugin_dir to the system path for imports
-            sys.path.insert(0, plugin_dir)
-
-            for filename in os.listdir(plugin_dir):
-                if filename.endswith(".py") and not filename.startswith("_"):
-                    filepath = os.path.join(plugin_dir, filename)
-                    module_name = f"user_plugin_{filename[:-3]}"
-                    try:
-                        spec = importlib.util.spec_from_file_location(
-                            module_name, filepath
-                        )
-                        if spec and spec.loader:
-                            user_mod = importlib.util.module_from_spec(spec)
-                            spec.loader.exec_module(user_mod)
-
-                            for name, obj in inspect.getmembers(user_mod):
-                                if inspect.isclass(obj) and issubclass(
-                                    obj, core.FetchModule
-                                ):
-                                    if obj is core.FetchModule:
-                                        continue
-
-                                    # Check for @cli_opts metadata; or defaults
-                                    mod_key = getattr(obj, "name", name.lower())
-                                    logger.info(f"Loaded user plugin: {mod_key}")
-
-                                    cls._modules[mod_key] = {
-                                        "mod": f"user_plugin_{filename[:-3]}",
-                                        "cls": name,
-                                        "category": "User Plugin",
-                                        "desc": getattr(
-                                            obj, "__doc__", "User defined module"
-                                        )
-                                        .strip()
-                                        .split("\n")[0],
-                                        "agency": "External",
-                                        "_class_obj": obj,
-                                    }
-
-                    except Exception as e:
-                        logger.warning(f"Failed to load plugin {filename}: {e}")
-
-            # Remove the plugin_dir from the system path
-            sys.path.pop(0)
+            manifest_path = cls.plugin_manifest_path(plugin_dir)
+            try:
+                with open(manifest_path, "rb") as f:
+                    manifest = utils.json_loads(f.read())
+            except (OSError, ValueError):
+                manifest = {}
+
+            new_manifest = {}
+            for dir_entry in plugin_files:
+                filename = dir_entry.name
+                if filename.startswith("_"):
+                    continue
+
+                filepath = dir_entry.path
+                module_name = f"user_plugin_{filename[:-3]}"
+                try:
+                    st = dir_entry.stat()
+                    stamp = [st.st_mtime_ns, st.st_size]
+                    cached = manifest.get(filename)
+                    if cached and cached.get("stamp") == stamp:
+                        found = [(record, None) for record in cached["modules"]]
+                    else:
+                        found = cls._scan_plugin(module_name, filepath)
+                except Exception as e:
+                    logger.warning(f"Failed to load plugin {filename}: {e}")
+                    continue
+
+                new_manifest[filename] = {
+                    "stamp": stamp,
+                    "modules": [record for record, _ in found],
+                }
+                for record, obj in found:
+                    mod_key = record["key"]
+                    logger.info(f"Loaded user plugin: {mod_key}")
+
+                    entry = {
+                        "mod": module_name,
+                        "cls": record["cls"],
+                        "category": "User Plugin",
+                        "desc": record["desc"],
+                        "agency": "External",
+                        "_plugin_path": filepath,
+                    }
+                    # Unchanged plugins are executed on demand by load_module
+                    if obj is not None:
+                        entry["_class_obj"] = obj
+
+                    cls._set_module(mod_key, entry)
+
+            if new_manifest != manifest:
+                try:
+                    utils.write_atomic(manifest_path, utils.json_dumps(new_manifest))
+                except OSError as e:
+                    logger.debug(
+                        f"Could not write plugin manifest {manifest_path}: {e}"
+                    )
 
     @classmethod
     def load_installed_plugins(cls):
         """Load plugins installed via Pip (entry_points)."""
 
+        if cls._installed_loaded:
+            return
+        cls._installed_loaded = True
+
         # Look for any installed package that registered a 'fetchez.plugins' entry point
         entry_points = importlib.metadata.entry_points(group="fetchez.plugins")
         for entry_point in entry_points:
@@ -1159,14 +1418,10 @@ class FetchezRegistry:
                 logger.error(f"Failed to load extension {entry_point.name}: {e}")
 
     @classmethod
-    def search_modules(cls, query: str) -> list:
-        """Search modules by matching the query string against:
-        Name, Description, Agency, Tags, License, Category, and Aliases.
-        """
-
-        query = query.lower()
-        matches = []
+    def _build_search_index(cls):
+        """Flatten each module's searchable metadata into one lowercase string."""
 
+        search_index = {}
         for key in cls._modules.keys():
             meta = cls.get_info(key)
 
@@ -1181,10 +1436,79 @@ class FetchezRegistry:
             searchable_text.extend(meta.get("tags", []))
             searchable_text.extend(meta.get("aliases", []))
 
-            if any(query in s.lower() for s in searchable_text):
-                matches.append(key)
+            search_index[key] = "\t".join(searchable_text).lower()
 
-        return sorted(matches)
+        return search_index
+
+    @classmethod
+    def search_modules(cls, query: str) -> list:
+        """Search modules by matching the query string against:
+        Name, Description, Agency, Tags, License, Category, and Aliases.
+
+        A multi-word query matches modules containing every word, in any
+        field and in any order (e.g. 'usgs lidar').
+        """
+
+        cls._ensure_plugins()
+        if cls._search_index is None:
+            cls._search_index = cls._build_search_index()
+
+        terms = query.lower().split()
+        return sorted(
+            k
+            for k, text in cls._search_index.items()
+            if all(term in text for term in terms)
+        )
+
+    @classmethod
+    def _field_index(cls, field: str) -> dict:
+        """Return (building on first use) the inverted index for `field`.
+
+        Maps each lowercased value of `field` to the set of module keys
+        carrying it; list fields such as `tags` index every item.
+        """
+
+        cls._ensure_plugins()
+        index = cls._field_indexes.get(field)
+        if index is None:
+            index = {}
+            for key in cls._modules.keys():
+                value = cls.get_info(key).get(field)
+                if not value:
+                    continue
+                if not isinstance(value, (list, tuple, set, frozenset)):
+                    value = [value]
+                for v in value:
+                    # Plugin metadata is free-form; only index strings
+                    if isinstance(v, str):
+                        index.setdefault(v.lower(), set()).add(key)
+            cls._field_indexes[field] = index
+
+        return index
+
+    @classmethod
+    def search_by_tag(cls, tag: str) -> list:
+        """Return the (sorted) keys of modules carrying exactly `tag`."""
+
+        return sorted(cls._field_index("tags").get(tag.lower(), ()))
+
+    @classmethod
+    def find_by_category(cls, category: str) -> list:
+        """Return the (sorted) keys of modules in `category` (e.g. 'Bathymetry')."""
+
+        return sorted(cls._field_index("category").get(category.lower(), ()))
+
+    @classmethod
+    def find_by_agency(cls, agency: str) -> list:
+        """Return the (sorted) keys of modules whose agency is exactly `agency`."""
+
+        return sorted(cls._field_index("agency").get(agency.lower(), ()))
+
+    @classmethod
+    def find_by_region(cls, region: str) -> list:
+        """Return the (sorted) keys of modules whose region is exactly `region`."""
+
+        return sorted(cls._field_index("region").get(region.lower(), ()))
 
     @classmethod
     def register_module(cls, mod_key, mod_cls, metadata=None):
@@ -1211,5 +1535,32 @@ class FetchezRegistry:
             "license": metadata.get("license", "Unknown"),
         }
 
-        cls._modules[mod_key] = entry
+        cls._set_module(mod_key, entry)
         logger.debug(f"Registered external module: {mod_key}")
+
+    @classmethod
+    def unregister_module(cls, mod_key):
+        """Remove a dynamically registered module.
+
+        Built-in modules cannot be removed; if the module had replaced a
+        built-in of the same name, that built-in is restored.
+
+        Returns:
+            bool: False if `mod_key` is not a dynamically registered module.
+        """
+
+        with _REGISTRY_LOCK:
+            entry = cls._modules.get(mod_key)
+            if entry is None or not cls._is_dynamic(entry):
+                return False
+
+            shadowed = cls._shadowed.pop(mod_key, None)
+            if shadowed is not None:
+                cls._modules[mod_key] = shadowed
+            else:
+                del cls._modules[mod_key]
+            cls._class_cache.pop(mod_key, None)
+            cls._clear_caches()
+
+        logger.debug(f"Unregistered module: {mod_key}")
+        return True
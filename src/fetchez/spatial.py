@@ -16,17 +16,18 @@ import os
 import json
 import math
 import logging
+import importlib.util
 from typing import Union, List, Tuple, Optional
 
-try:
-    from shapely.geometry import shape, box
-
-    HAS_SHAPELY = True
-except ImportError:
-    HAS_SHAPELY = False
+# shapely (and numpy under it) is slow to import, so only check that it is
+# installed here and import it where it is actually used.
+HAS_SHAPELY = importlib.util.find_spec("shapely") is not None
 
 logger = logging.getLogger(__name__)
 
+# Translation table for filename-safe region strings: '.' -> 'p', '-' -> 'm'
+REGION_SLUG_TABLE = str.maketrans({".": "p", "-": "m"})
+
 
 def region_help_msg():
     return """Region Formats:
@@ -228,6 +229,9 @@ class Region:
     def to_shapely(self):
         if not HAS_SHAPELY:
             return None
+
+        from shapely.geometry import box
+
         return box(self.xmin, self.ymin, self.xmax, self.ymax)
 
     def to_wkt(self):
@@ -304,6 +308,8 @@ def region_from_geojson(fn: str) -> Optional[List[Region]]:
                 continue
 
             if HAS_SHAPELY:
+                from shapely.geometry import shape
+
                 b = shape(geom).bounds  # (minx, miny, maxx, maxy)
                 min_x, min_y = min(min_x, b[0]), min(min_y, b[1])
                 max_x, max_y = max(max_x, b[2]), max(max_y, b[3])
@@ -442,6 +448,8 @@ def region_to_shapely(region: Tuple[float, float, float, float]):
     if not region or not HAS_SHAPELY:
         return None
 
+    from shapely.geometry import box
+
     west, east, south, north = region
     return box(west, south, east, north)
 
@@ -453,6 +461,17 @@ def region_to_wkt(region: Tuple[float, float, float, float]):
     return polygon.wkt
 
 
+def region_to_footprint(region: Tuple[float, float, float, float]) -> str:
+    """Convert a fetchez region to a closed, counter-clockwise WKT POLYGON.
+
+    Unlike `region_to_wkt` this does not require shapely, and it keeps the
+    'POLYGON((w s, e s, e n, w n, w s))' form expected by the OData/DAV APIs.
+    """
+
+    w, e, s, n = region
+    return f"POLYGON(({w} {s}, {e} {s}, {e} {n}, {w} {n}, {w} {s}))"
+
+
 def region_to_bbox(region: Tuple[float, float, float, float]):
     """Convert a fetchez region to a `bbox`"""
 
@@ -460,6 +479,16 @@ def region_to_bbox(region: Tuple[float, float, float, float]):
     return (w, s, e, n)
 
 
+def region_to_slug(region: Tuple[float, float, float, float]) -> str:
+    """Convert a fetchez region to a filename-safe string.
+
+    e.g. (-105.5, -104.5, 39.5, 40.5) -> 'wm105p5_em104p5_s39p5_n40p5'
+    """
+
+    w, e, s, n = region
+    return f"w{w}_e{e}_s{s}_n{n}".translate(REGION_SLUG_TABLE)
+
+
 def region_to_geojson_geom(region: Tuple[float, float, float, float]):
     w, e, s, n = region
     # geom = {
@@ -22,7 +22,17 @@ import shutil
 import tempfile
 import tqdm
 import re
-from typing import Optional, Dict, Any
+import json
+import time
+import functools
+from typing import Optional, Dict, Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +131,42 @@ def today_str():
     return datetime.datetime.now().strftime("%Y-%m-%d")
 
 
+@functools.lru_cache(maxsize=8)
+def _yyyymmdd(minute: int, days_ago: int, utc: bool) -> str:
+    tz = datetime.timezone.utc if utc else None
+    dt = datetime.datetime.fromtimestamp(minute * 60, tz) - datetime.timedelta(
+        days=days_ago
+    )
+    return dt.strftime("%Y%m%d")
+
+
+def yyyymmdd(days_ago: int = 0, utc: bool = False) -> str:
+    """Get the date `days_ago` days before today as "YYYYMMDD".
+
+    Memoized per minute, so batch runs don't re-format the same date.
+    """
+
+    return _yyyymmdd(int(time.time()) // 60, days_ago, utc)
+
+
+def json_loads(data: Union[bytes, memoryview, str]) -> Any:
+    """Parse JSON `data` with orjson (if available), else the stdlib json."""
+
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize `obj` to a compact JSON string, with orjson if available."""
+
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
 def get_username():
     username = ""
     while not username:
@@ -321,6 +367,31 @@ def make_temp_fn(basename, temp_dir=None):
     return path
 
 
+def write_atomic(filepath: str, data: Union[bytes, str]):
+    """Write `data` to `filepath` through a unique temporary file.
+
+    The temporary file is created next to `filepath` and moved over it with
+    `os.replace`, so concurrent writers (threads or processes) never clobber
+    each other's partial output and readers never see a truncated file.
+    """
+
+    dirname = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(dirname, exist_ok=True)
+    fd, tmp_fn = tempfile.mkstemp(
+        dir=dirname, prefix=f".{os.path.basename(filepath)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+        os.replace(tmp_fn, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_fn)
+        except OSError:
+            pass
+        raise
+
+
 def parse_fmod(fmod):
     """Parse a factory module string.
 
@@ -482,6 +553,35 @@ def p_f_unzip(src_file, fns=None, outdir="./", tmp_fn=False):
 # =============================================================================
 # Hooks
 # =============================================================================
+def _repr_key(item):
+    return repr(item[0])
+
+
+def _hashable(value):
+    """Convert nested hook arguments into a hashable form."""
+
+    if isinstance(value, dict):
+        # Sort on repr: YAML keys can mix types (e.g. {1: 2.0, "lidar": 1.0})
+        return tuple(
+            sorted(((k, _hashable(v)) for k, v in value.items()), key=_repr_key)
+        )
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def hook_spec_key(name, kwargs):
+    """Return a cache key identifying a hook by name and arguments."""
+
+    return (name, _hashable(kwargs))
+
+
 def merge_hooks(global_hooks, local_hooks):
     """Merge global and local hooks, removing exact duplicates.
 
@@ -0,0 +1,157 @@
+import io
+import re
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from fetchez import core
+from fetchez.modules.vdatum import VDatum
+
+RANGE_RX = re.compile(r"bytes=(\d+)-(\d+)")
+
+
+def make_zip():
+    """A small ZIP with an .inf member and a larger, incompressible grid."""
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("region/mllw.inf", b"west longitude = -80.5\neast longitude = -79\n")
+        z.writestr("region/mllw.gtx", bytes(range(256)) * 2048)
+        z.writestr("region/readme.txt", b"hello\n" * 100)
+    return buf.getvalue()
+
+
+ZIP_BYTES = make_zip()
+
+
+def make_handler(data, honor_range, head_size=True):
+    class Handler(BaseHTTPRequestHandler):
+        requests_seen = []
+
+        def log_message(self, *args):
+            pass
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)) if head_size else "0")
+            self.send_header("Accept-Ranges", "bytes" if honor_range else "none")
+            self.end_headers()
+
+        def do_GET(self):
+            m = RANGE_RX.match(self.headers.get("Range", ""))
+            self.requests_seen.append(self.headers.get("Range"))
+            if honor_range and m:
+                start, end = int(m.group(1)), min(int(m.group(2)), len(data) - 1)
+                body = data[start : end + 1]
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            else:
+                body = data
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def serve(handler):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}/data.zip"
+
+
+@pytest.fixture(params=[True, False], ids=["range", "no-range"])
+def server(request):
+    """Serve ZIP_BYTES at /data.zip, with or without Range support."""
+
+    handler = make_handler(ZIP_BYTES, honor_range=request.param)
+    httpd, url = serve(handler)
+
+    yield url, handler
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_httpfile_seek_read(server):
+    """Do seek/read return the right bytes, with or without Range support?"""
+
+    url, _ = server
+    with requests.Session() as session:
+        remote = core.HttpFile(url, session=session, block_size=1024)
+        assert remote.size == len(ZIP_BYTES)
+
+        assert remote.read(10) == ZIP_BYTES[:10]
+        assert remote.tell() == 10
+
+        remote.seek(-22, io.SEEK_END)
+        assert remote.read() == ZIP_BYTES[-22:]
+
+        remote.seek(5000)
+        assert remote.read(3000) == ZIP_BYTES[5000:8000]
+
+        remote.seek(len(ZIP_BYTES) - 5)
+        assert remote.read(100) == ZIP_BYTES[-5:]
+        assert remote.read(1) == b""
+
+
+def test_httpfile_read_ahead(server):
+    """Are small reads served from the last fetched block?"""
+
+    url, handler = server
+    with requests.Session() as session:
+        remote = core.HttpFile(url, session=session, block_size=4096)
+        handler.requests_seen.clear()
+
+        data = b"".join(remote.read(16) for _ in range(256))
+        assert data == ZIP_BYTES[:4096]
+        assert len(handler.requests_seen) == 1
+
+
+def test_httpfile_zipfile(server):
+    """Can zipfile read every member byte-for-byte through HttpFile?"""
+
+    url, _ = server
+    with requests.Session() as session:
+        remote = core.HttpFile(url, session=session, block_size=1024)
+        with zipfile.ZipFile(remote) as z, zipfile.ZipFile(
+            io.BytesIO(ZIP_BYTES)
+        ) as expected:
+            assert z.namelist() == expected.namelist()
+            for name in expected.namelist():
+                assert z.read(name) == expected.read(name)
+
+
+def test_vdatum_open_zip(server, tmp_path):
+    """Does VDatum read the ZIP index remotely instead of downloading it?"""
+
+    url, _ = server
+    local_zip = tmp_path / "data.zip"
+
+    z = VDatum.__new__(VDatum)._open_zip(url, str(local_zip))
+    with z:
+        assert z.read("region/mllw.inf").startswith(b"west longitude")
+
+    assert not local_zip.exists()
+
+
+def test_vdatum_open_zip_fallback(tmp_path):
+    """Is the whole ZIP downloaded when the remote size is unknown?"""
+
+    httpd, url = serve(make_handler(ZIP_BYTES, honor_range=True, head_size=False))
+    local_zip = tmp_path / "data.zip"
+
+    try:
+        z = VDatum.__new__(VDatum)._open_zip(url, str(local_zip))
+        with z:
+            assert z.read("region/mllw.inf").startswith(b"west longitude")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert local_zip.read_bytes() == ZIP_BYTES
@@ -0,0 +1,28 @@
+import pytest
+
+from fetchez.recipe import _parse_version
+
+
+@pytest.mark.parametrize(
+    "v_str, expected",
+    [
+        ("2.1.0", (2, 1, 0)),
+        ("2.1.0-beta", (2, 1, 0)),
+        ("0.4.3rc1", (0, 4, 3)),
+        ("v1.2", (1, 2)),
+        ("1.x.3", (1, 0, 3)),
+        ("", (0,)),
+    ],
+)
+def test_parse_version(v_str, expected):
+    """Are version strings parsed into positional integer tuples?"""
+
+    assert _parse_version(v_str) == expected
+
+
+def test_parse_version_ordering():
+    """Do parsed versions compare the way min_fetchez_version expects?"""
+
+    assert _parse_version("1.x.3") < _parse_version("1.1.0")
+    assert _parse_version("0.10.0") > _parse_version("0.9.9")
+    assert _parse_version("1.0.0-beta") >= _parse_version("1.0.0")
@@ -0,0 +1,196 @@
+import os
+import json
+
+import pytest
+
+from fetchez.registry import FetchezRegistry
+
+PLUGIN_SRC = '''
+from fetchez.core import FetchModule
+
+
+class MyData(FetchModule):
+    """{desc}
+
+    More details that should not end up in the registry.
+    """
+'''
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """A FetchezRegistry with its class-level state isolated per test,
+    looking for user plugins in a temporary HOME.
+    """
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    # Not HOME, so ./.fetchez/plugins is a different (empty) directory
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    monkeypatch.chdir(workdir)
+
+    monkeypatch.setattr(FetchezRegistry, "_modules", dict(FetchezRegistry._modules))
+    monkeypatch.setattr(FetchezRegistry, "_class_cache", {})
+    monkeypatch.setattr(FetchezRegistry, "_plugin_modules", {})
+    monkeypatch.setattr(FetchezRegistry, "_shadowed", {})
+    monkeypatch.setattr(FetchezRegistry, "_info_cache", {})
+    monkeypatch.setattr(FetchezRegistry, "_alias_index", None)
+    monkeypatch.setattr(FetchezRegistry, "_search_index", None)
+    monkeypatch.setattr(FetchezRegistry, "_field_indexes", {})
+    monkeypatch.setattr(FetchezRegistry, "_user_loaded", False)
+    # Keep pip-installed extensions out of the tests
+    monkeypatch.setattr(FetchezRegistry, "_installed_loaded", True)
+    monkeypatch.setattr(FetchezRegistry, "_plugins_ready", False)
+
+    return FetchezRegistry
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    """~/.fetchez/plugins with a single plugin file."""
+
+    path = tmp_path / ".fetchez" / "plugins"
+    path.mkdir(parents=True)
+    (path / "mydata.py").write_text(PLUGIN_SRC.format(desc="My test data."))
+    return path
+
+
+def reload_plugins(registry, monkeypatch):
+    """Simulate a new process: forget the plugins and scan again."""
+
+    monkeypatch.setattr(registry, "_modules", dict(registry._modules))
+    registry._modules.pop("mydata", None)
+    registry._plugin_modules.clear()
+    registry._clear_caches()
+    monkeypatch.setattr(registry, "_user_loaded", False)
+    registry.load_user_plugins()
+
+
+def test_plugin_first_run(registry, plugin_dir):
+    """Does the first scan execute the plugin and write the manifest?"""
+
+    registry.load_user_plugins()
+
+    entry = registry._modules["mydata"]
+    assert entry["desc"] == "My test data."
+    assert entry["_class_obj"].__name__ == "MyData"
+
+    # Kept in the user's cache, not next to the plugins
+    assert os.listdir(plugin_dir) == ["mydata.py"]
+    with open(registry.plugin_manifest_path(str(plugin_dir))) as f:
+        manifest = json.load(f)
+
+    st = os.stat(plugin_dir / "mydata.py")
+    assert manifest["mydata.py"]["stamp"] == [st.st_mtime_ns, st.st_size]
+    assert manifest["mydata.py"]["modules"] == [
+        {"key": "mydata", "cls": "MyData", "desc": "My test data."}
+    ]
+
+
+def test_plugin_cached_run(registry, plugin_dir, monkeypatch):
+    """Is an unchanged plugin registered from the manifest without running it?"""
+
+    registry.load_user_plugins()
+    reload_plugins(registry, monkeypatch)
+
+    entry = registry._modules["mydata"]
+    assert "_class_obj" not in entry
+    assert entry["_plugin_path"] == str(plugin_dir / "mydata.py")
+    assert entry["desc"] == "My test data."
+    assert not registry._plugin_modules
+
+
+def test_plugin_lazy_load_module(registry, plugin_dir, monkeypatch):
+    """Does load_module execute a manifest-registered plugin on demand?"""
+
+    registry.load_user_plugins()
+    reload_plugins(registry, monkeypatch)
+
+    mod_cls = registry.load_module("mydata")
+    assert mod_cls.__name__ == "MyData"
+    assert registry._modules["mydata"]["_class_obj"] is mod_cls
+    assert registry.load_module("mydata") is mod_cls
+
+
+def test_plugin_rescan_on_change(registry, plugin_dir, monkeypatch):
+    """Is a plugin re-executed once its file changes?"""
+
+    registry.load_user_plugins()
+
+    plugin_fn = plugin_dir / "mydata.py"
+    plugin_fn.write_text(PLUGIN_SRC.format(desc="Updated test data."))
+    st = os.stat(plugin_fn)
+    os.utime(plugin_fn, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    reload_plugins(registry, monkeypatch)
+
+    entry = registry._modules["mydata"]
+    assert entry["desc"] == "Updated test data."
+    assert "_class_obj" in entry
+
+    with open(registry.plugin_manifest_path(str(plugin_dir))) as f:
+        manifest = json.load(f)
+    assert manifest["mydata.py"]["modules"][0]["desc"] == "Updated test data."
+
+
+def test_alias_resolution(registry):
+    """Do aliases resolve to their module in get_info and load_module?"""
+
+    assert registry.resolve_key("local_index") == "fred_local"
+    assert registry.resolve_key("not_a_module") is None
+    assert registry.get_info("local_index") is registry.get_info("fred_local")
+    assert registry.get_info("not_a_module") == {}
+
+    assert registry.load_module("local_index") is registry.load_module("fred_local")
+    assert registry.load_module("not_a_module") is None
+
+
+def test_search_modules(registry):
+    """Do single and multi-word searches match across fields?"""
+
+    assert "gmrt" in registry.search_modules("Bathymetry")
+    assert "gebco" in registry.search_modules("gebco global")
+    # Every word has to match, in any order
+    assert "gebco" in registry.search_modules("global gebco")
+    assert "gebco" not in registry.search_modules("gebco lidar")
+    assert registry.search_modules("no-such-module-anywhere") == []
+
+
+def test_register_invalidates_caches(registry):
+    """Do lookups see modules as they are registered and unregistered?"""
+
+    GMRT = registry.load_module("gmrt")
+    assert registry.search_by_tag("test-tag") == []
+    assert registry.search_modules("test-tag") == []
+
+    registry.register_module(
+        "test_mod", GMRT, {"category": "Testing", "tags": ("test-tag",)}
+    )
+    assert registry.search_by_tag("TEST-TAG") == ["test_mod"]
+    assert registry.search_modules("test-tag") == ["test_mod"]
+    assert registry.find_by_category("testing") == ["test_mod"]
+    assert registry.get_info("test_mod")["category"] == "Testing"
+    assert registry.load_module("test_mod") is GMRT
+
+    assert registry.unregister_module("test_mod")
+    assert registry.search_by_tag("test-tag") == []
+    assert registry.search_modules("test-tag") == []
+    assert registry.get_info("test_mod") == {}
+    assert registry.load_module("test_mod") is None
+    assert not registry.unregister_module("test_mod")
+
+
+def test_unregister_restores_builtin(registry):
+    """Does unregistering a plugin that replaced a built-in restore it?"""
+
+    GMRT = registry.load_module("gmrt")
+    GEBCO = registry.load_module("gebco")
+
+    assert not registry.unregister_module("gmrt")
+
+    registry.register_module("gmrt", GEBCO)
+    assert registry.load_module("gmrt") is GEBCO
+
+    assert registry.unregister_module("gmrt")
+    assert registry.load_module("gmrt") is GMRT
+    assert registry.get_info("gmrt")["category"] == "Bathymetry"
@@ -0,0 +1,194 @@
+import os
+import time
+
+import pytest
+
+from fetchez import _engine
+from fetchez.core import FetchModule
+from fetchez.hooks import FetchHook
+from fetchez.hooks.registry import HookRegistry
+from fetchez.registry import FetchezRegistry
+
+REGION = [-105.5, -104.5, 39.5, 40.5]
+
+
+class Boom(FetchHook):
+    name = "boom"
+
+    def __init__(self, **kwargs):
+        raise ValueError("boom")
+
+
+class BadModule(FetchModule):
+    def __init__(self, **kwargs):
+        raise ValueError("bad module")
+
+
+@pytest.fixture
+def workflow(tmp_path, monkeypatch):
+    """Build Workflows rooted at a temporary base_dir."""
+
+    monkeypatch.chdir(tmp_path)
+    # Only the built-in modules; no user or pip plugins
+    monkeypatch.setattr(FetchezRegistry, "_plugins_ready", True)
+    monkeypatch.setitem(HookRegistry._hooks, "boom", Boom)
+    monkeypatch.setitem(
+        FetchezRegistry._modules,
+        "bad_mod",
+        {"mod": __name__, "cls": "BadModule", "_class_obj": BadModule},
+    )
+
+    def make(config):
+        return _engine.Workflow(config, base_dir=str(tmp_path))
+
+    return make
+
+
+def test_shared_hook_instances(workflow):
+    """Do identical hook specs share one instance (and different ones not)?"""
+
+    wf = workflow({})
+    a = wf._init_hooks([{"name": "unzip", "args": {"remove": True}}])
+    b = wf._init_hooks([{"name": "unzip", "args": {"remove": True}}])
+    c = wf._init_hooks([{"name": "unzip", "args": {"remove": False}}])
+
+    assert a[0] is b[0]
+    assert a[0] is not c[0]
+
+
+def test_shared_hook_mixed_keys(workflow):
+    """Are hooks with mixed-type dict keys (from YAML) still built and shared?"""
+
+    wf = workflow({})
+    a = wf._init_hooks(
+        [{"name": "set_weight", "args": {"rules": {1: 2.0, "lidar": 1.0}}}]
+    )
+    b = wf._init_hooks(
+        [{"name": "set_weight", "args": {"rules": {"lidar": 1.0, 1: 2.0}}}]
+    )
+
+    assert len(a) == 1
+    assert a[0] is b[0]
+
+
+def test_unshareable_hooks(workflow):
+    """Does a hook with `shareable = False` (audit) get its own instance?"""
+
+    wf = workflow({})
+    a = wf._init_hooks([{"name": "audit", "args": {"file": "audit.json"}}])
+    b = wf._init_hooks([{"name": "audit", "args": {"file": "audit.json"}}])
+
+    assert a[0] is not b[0]
+
+
+def test_resolve_paths(workflow, tmp_path):
+    """Are relative hook and module paths resolved against base_dir?"""
+
+    wf = workflow({})
+    hooks = wf._init_hooks(
+        [
+            {"name": "audit", "args": {"file": "logs/audit.json"}},
+            {"name": "audit", "args": {"file": "/abs/audit.json"}},
+        ]
+    )
+    assert hooks[0].filename == os.path.join(str(tmp_path), "logs", "audit.json")
+    assert hooks[1].filename == "/abs/audit.json"
+
+    assert wf._resolve_path("https://example.com/a.tif") == "https://example.com/a.tif"
+    assert wf._resolve_path("s3://bucket/a.tif") == "s3://bucket/a.tif"
+
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "a.tif").write_bytes(b"")
+    mod_def = {"module": "file", "args": {"path": "data/a.tif"}}
+    wf = workflow({"region": REGION, "modules": [mod_def]})
+
+    mods = wf._build_modules()
+    assert mods[0].file_list == [os.path.join(str(tmp_path), "data", "a.tif")]
+    # The config itself is left untouched
+    assert mod_def["args"]["path"] == "data/a.tif"
+
+
+def test_bare_string_modules(workflow):
+    """Are bare module names built once per region with no hooks?"""
+
+    wf = workflow(
+        {"region": [REGION, [-80, -79, 30, 31]], "modules": ["gmrt", "local_index"]}
+    )
+    mods = wf._build_modules()
+
+    assert [type(m).__name__ for m in mods] == ["GMRT", "GMRT", "Local", "Local"]
+    assert all(m.hooks == [] for m in mods)
+    assert [tuple(m.region) for m in mods[:2]] == [
+        tuple(REGION),
+        (-80, -79, 30, 31),
+    ]
+
+
+def test_skip_on_failure(workflow):
+    """Are failing hooks and modules logged and skipped, not raised?"""
+
+    wf = workflow(
+        {
+            "region": REGION,
+            "modules": [
+                "bad_mod",
+                "no_such_module",
+                {
+                    "module": "gmrt",
+                    "hooks": [
+                        {"name": "boom"},
+                        {"name": "no_such_hook"},
+                        {"name": "unzip"},
+                    ],
+                },
+            ],
+        }
+    )
+    mods = wf._build_modules()
+
+    assert [type(m).__name__ for m in mods] == ["GMRT"]
+    assert [h.name for h in mods[0].hooks] == ["unzip"]
+
+    class Failing:
+        name = "failing"
+
+        def run(self):
+            raise RuntimeError("no urls")
+
+    _engine._run_module(Failing())
+
+
+def test_no_region_skips_module(workflow):
+    """Is a module without any target region skipped?"""
+
+    wf = workflow({"modules": ["gmrt"]})
+    assert wf._build_modules() == []
+
+
+class Recorder(FetchModule):
+    events = []
+
+    def run(self):
+        self.events.append(("start", self.region))
+        time.sleep(0.05)
+        self.events.append(("end", self.region))
+
+
+def test_first_instance_runs_alone(workflow, monkeypatch):
+    """Does the first instance of a module finish before the others start?"""
+
+    monkeypatch.setattr(_engine, "run_fetchez", lambda *args, **kwargs: None)
+    monkeypatch.setitem(
+        FetchezRegistry._modules,
+        "recorder",
+        {"mod": __name__, "cls": "Recorder", "_class_obj": Recorder},
+    )
+    regions = [[-105, -104, 39, 40], [-104, -103, 39, 40], [-103, -102, 39, 40]]
+    wf = workflow({"region": regions, "modules": ["recorder"]})
+
+    assert wf._run_modules()
+    assert Recorder.events[:2] == [
+        ("start", regions[0]),
+        ("end", regions[0]),
+    ]
+    assert len(Recorder.events) == 6